@@ -3,6 +3,7 @@ API integration layer for multiple academic paper databases
 """
 
 import time
+import threading
 import requests
 import re
 from typing import List, Dict, Optional
@@ -11,6 +12,25 @@ import arxiv
 import config
 
 
+# One pooled HTTP session shared by the REST clients, so repeated searches reuse
+# keep-alive connections instead of paying a TCP/TLS handshake per request
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide requests.Session, creating it on first use"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _shared_session = session
+    return _shared_session
+
+
 class RateLimiter:
     """Rate limiter to respect API limits"""
 
@@ -244,8 +264,9 @@ class ArXivClient:
 class PapersWithCodeClient:
     """Client for Papers With Code API"""
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.base_url = "https://paperswithcode.com/api/v1"
+        self.session = session or get_shared_session()
         self.rate_limiter = RateLimiter(config.RATE_LIMITS['papers_with_code'])
 
     def get_implementations(self, paper_title: str, paper_doi: Optional[str] = None) -> Optional[Dict]:
@@ -255,7 +276,7 @@ class PapersWithCodeClient:
         try:
             # Search for paper by title
             search_params = {'q': paper_title}
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/papers/",
                 params=search_params,
                 timeout=10
@@ -269,7 +290,7 @@ class PapersWithCodeClient:
 
                     # Get repositories for this paper
                     self.rate_limiter.wait()
-                    repos_response = requests.get(
+                    repos_response = self.session.get(
                         f"{self.base_url}/papers/{paper_id}/repositories/",
                         timeout=10
                     )
@@ -81,6 +81,7 @@ GROK_SETTINGS = {
     'timeout': 30,
     'max_tokens': 1000,
     'temperature': 0.7,
+    'max_concurrent_requests': 11,  # Cap on simultaneous Grok calls from parallel analysis agents
     'features': {
         'query_enhancement': True,
         'paper_summarization': True,
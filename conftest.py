@@ -0,0 +1,111 @@
+"""
+Pytest session setup
+====================
+
+Fixtures shared across test files: lazily warmed-up heavy components
+(embedding model, tokenizer/splitter, FAISS) for the tests that time them,
+so their timings reflect steady state rather than model load and first-call
+initialization, plus the RAG pipeline, temp database, analysis orchestrator
+and agents. Nothing is loaded until a test requests it.
+"""
+
+import pytest
+
+# Paper indexed by the shared RAG pipeline; tests vary only the query
+SAMPLE_PAPER = {
+    'title': 'Test Paper on Quantum Computing',
+    'sections': {'introduction': 'This is test content about quantum computing, machine learning, and their applications in scientific research domains.'}
+}
+
+
+def _warm_embeddings():
+    from rag_system.embeddings import EmbeddingsManager
+
+    EmbeddingsManager().generate_embeddings(["warmup"], show_progress=False)
+
+
+def _warm_chunker():
+    from rag_system.text_chunker import TextChunker
+
+    TextChunker().chunk_document("warmup")
+
+
+def _warm_faiss():
+    import faiss
+    import numpy as np
+
+    index = faiss.IndexFlatL2(384)
+    index.add(np.zeros((1, 384), dtype=np.float32))
+    index.search(np.zeros((1, 384), dtype=np.float32), 1)
+
+
+def _warm(name, warm):
+    try:
+        warm()
+    except Exception as e:
+        # Missing optional dependency or model download failure - tests report it themselves
+        print(f"⚠️  Warmup skipped for {name}: {e}")
+
+
+@pytest.fixture(scope="session")
+def warm_embeddings():
+    """Load the embedding model and run a first encode, once per session"""
+    _warm("embeddings", _warm_embeddings)
+
+
+@pytest.fixture(scope="session")
+def warm_chunker():
+    """Initialize the tokenizer/splitter and chunk a first document, once per session"""
+    _warm("chunker", _warm_chunker)
+
+
+@pytest.fixture(scope="session")
+def warm_faiss():
+    """Import FAISS and run a first search, once per session"""
+    _warm("faiss", _warm_faiss)
+
+
+@pytest.fixture(scope="session")
+def rag_components():
+    """RAG pipeline built once over SAMPLE_PAPER"""
+    from rag_system.enhanced_rag import create_enhanced_rag_system
+
+    return create_enhanced_rag_system(paper_data=SAMPLE_PAPER)
+
+
+@pytest.fixture(scope="module")
+def db_path(tmp_path_factory):
+    """One temporary database path shared by the tests of a module"""
+    return str(tmp_path_factory.mktemp("ragdb") / "test.db")
+
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    """DocumentAnalysisOrchestrator shared by the analysis tests"""
+    from rag_system.analysis_agents import DocumentAnalysisOrchestrator
+
+    return DocumentAnalysisOrchestrator()
+
+
+@pytest.fixture(scope="session")
+def synthesizer():
+    """SynthesisAgent shared by the analysis tests"""
+    from rag_system.analysis_agents import SynthesisAgent
+
+    return SynthesisAgent()
+
+
+@pytest.fixture(scope="session")
+def intro_agent():
+    """IntroductionAgent shared by the analysis tests"""
+    from rag_system.analysis_agents.introduction_agent import IntroductionAgent
+
+    return IntroductionAgent()
+
+
+@pytest.fixture(scope="session")
+def lit_agent():
+    """LiteratureReviewAgent shared by the analysis tests"""
+    from rag_system.analysis_agents.literature_review_agent import LiteratureReviewAgent
+
+    return LiteratureReviewAgent()
@@ -5,15 +5,16 @@ Extended API clients for OpenAlex, CORE, Crossref, and PubMed
 import time
 import requests
 from typing import List, Dict, Optional
-from api_clients import RateLimiter
+from api_clients import RateLimiter, get_shared_session
 import config
 
 
 class OpenAlexClient:
     """Client for OpenAlex API - 240M+ papers, completely free"""
 
-    def __init__(self, email: Optional[str] = None):
+    def __init__(self, email: Optional[str] = None, session: Optional[requests.Session] = None):
         self.base_url = "https://api.openalex.org"
+        self.session = session or get_shared_session()
         self.email = email
         self.rate_limiter = RateLimiter(0.1)  # 10 requests/second
 
@@ -33,7 +34,7 @@ class OpenAlexClient:
             if self.email:
                 params['mailto'] = self.email
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/works",
                 params=params,
                 timeout=15
@@ -109,8 +110,9 @@ class OpenAlexClient:
 class CrossrefClient:
     """Client for Crossref API - 150M+ DOI records"""
 
-    def __init__(self, email: Optional[str] = None):
+    def __init__(self, email: Optional[str] = None, session: Optional[requests.Session] = None):
         self.base_url = "https://api.crossref.org"
+        self.session = session or get_shared_session()
         self.email = email
         self.rate_limiter = RateLimiter(1.0)  # Be polite
 
@@ -130,7 +132,7 @@ class CrossrefClient:
             if self.email:
                 headers['User-Agent'] = f'ResearchPaperDiscovery/1.0 (mailto:{self.email})'
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/works",
                 params=params,
                 headers=headers,
@@ -199,8 +201,9 @@ class CrossrefClient:
 class COREClient:
     """Client for CORE API - Open Access papers"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         self.base_url = "https://api.core.ac.uk/v3"
+        self.session = session or get_shared_session()
         self.api_key = api_key
         self.rate_limiter = RateLimiter(2.0)  # 1 request per 2 seconds for free tier
 
@@ -221,7 +224,7 @@ class COREClient:
                 'limit': min(max_results, 100)
             }
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/search/works",
                 params=params,
                 timeout=15
@@ -275,8 +278,10 @@ class COREClient:
 class PubMedClient:
     """Client for PubMed/NCBI E-utilities - Biomedical papers"""
 
-    def __init__(self, email: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(self, email: Optional[str] = None, api_key: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+        self.session = session or get_shared_session()
         self.email = email
         self.api_key = api_key
         self.rate_limiter = RateLimiter(0.34 if not api_key else 0.1)  # 3/sec or 10/sec with key
@@ -301,7 +306,7 @@ class PubMedClient:
                 search_params['api_key'] = self.api_key
 
             self.rate_limiter.wait()
-            search_response = requests.get(
+            search_response = self.session.get(
                 f"{self.base_url}/esearch.fcgi",
                 params=search_params,
                 timeout=15
@@ -328,7 +333,7 @@ class PubMedClient:
             if self.api_key:
                 fetch_params['api_key'] = self.api_key
 
-            fetch_response = requests.get(
+            fetch_response = self.session.get(
                 f"{self.base_url}/efetch.fcgi",
                 params=fetch_params,
                 timeout=15
@@ -40,6 +40,9 @@ class GrokClient:
         }
         self.is_validated = False
 
+        # Reuse one HTTP session so keep-alive connections survive between calls
+        self.session = requests.Session()
+
         # Validate API key on initialization if requested
         if validate:
             self.validate_connection()
@@ -50,7 +53,7 @@ class GrokClient:
         Returns True if connection is valid, False otherwise
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json={
@@ -83,7 +86,7 @@ class GrokClient:
     def generate(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> str:
         """Generate text from prompt"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json={
@@ -115,7 +118,7 @@ class GrokClient:
     def chat(self, messages: List[Dict[str, str]], max_tokens: int = 1000, temperature: float = 0.7) -> str:
         """Chat-based generation with conversation history"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json={
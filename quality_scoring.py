@@ -6,6 +6,8 @@ from typing import Dict, List
 import config
 from datetime import datetime
 
+import numpy as np
+
 
 class PaperQualityScorer:
     """Calculate quality scores for research papers"""
@@ -23,33 +25,98 @@ class PaperQualityScorer:
         - Venue quality (20%): Conference/journal rankings
         - Recency (10%): Publication date
         - Additional signals (5%): GitHub stars, etc.
+
+        Routed through calculate_scores_batch so single and bulk scoring share one code path.
+        """
+        return float(self.calculate_scores_batch([paper])[0])
+
+    def calculate_scores_batch(self, papers: List[Dict]) -> np.ndarray:
+        """
+        Calculate quality scores for many papers at once
+
+        The numeric components (citations, recency) are computed column-wise with
+        NumPy; the string-matching components (authors, venue, additional signals)
+        are still evaluated per paper. Results match combining the per-paper
+        component methods (_calculate_citation_score etc.).
+
+        Returns:
+            Array of scores (rounded to 3 decimals), one per paper
         """
+        if not papers:
+            return np.zeros(0)
 
         # Citation component (40%)
-        citation_score = self._calculate_citation_score(paper)
+        citation_scores = self._calculate_citation_scores_batch(papers)
 
         # Author component (25%)
-        author_score = self._calculate_author_score(paper)
+        author_scores = np.array([self._calculate_author_score(p) for p in papers], dtype=float)
 
         # Venue component (20%)
-        venue_score = self._calculate_venue_score(paper)
+        venue_scores = np.array([self._calculate_venue_score(p) for p in papers], dtype=float)
 
         # Recency component (10%)
-        recency_score = self._calculate_recency_score(paper)
+        recency_scores = self._calculate_recency_scores_batch(papers)
 
         # Additional signals (5%)
-        additional_score = self._calculate_additional_signals(paper)
+        additional_scores = np.array([self._calculate_additional_signals(p) for p in papers], dtype=float)
 
         # Weighted combination
-        final_score = (
-            config.QUALITY_WEIGHTS['citations'] * citation_score +
-            config.QUALITY_WEIGHTS['author_reputation'] * author_score +
-            config.QUALITY_WEIGHTS['venue_quality'] * venue_score +
-            config.QUALITY_WEIGHTS['recency'] * recency_score +
-            config.QUALITY_WEIGHTS['additional_signals'] * additional_score
+        final_scores = (
+            config.QUALITY_WEIGHTS['citations'] * citation_scores +
+            config.QUALITY_WEIGHTS['author_reputation'] * author_scores +
+            config.QUALITY_WEIGHTS['venue_quality'] * venue_scores +
+            config.QUALITY_WEIGHTS['recency'] * recency_scores +
+            config.QUALITY_WEIGHTS['additional_signals'] * additional_scores
         )
 
-        return round(final_score, 3)
+        # Python's round() rather than np.round(): np.round scales by 10**3 before
+        # rounding, which can land on the other side of a .0005 boundary
+        return np.array([round(score, 3) for score in final_scores.tolist()])
+
+    def _calculate_citation_scores_batch(self, papers: List[Dict]) -> np.ndarray:
+        """Vectorized _calculate_citation_score over a list of papers"""
+        # Invalid (None/negative) counts become 0
+        citations = np.maximum(
+            np.array([p.get('citations', 0) or 0 for p in papers], dtype=float), 0)
+        influential = np.maximum(
+            np.array([p.get('influential_citations', 0) or 0 for p in papers], dtype=float), 0)
+
+        # Missing year defaults to current year; explicit None counts as unknown (0).
+        # Like the scalar path, only unknown and future years score 0
+        years = np.array([p.get('year', self.current_year) or 0 for p in papers], dtype=float)
+        valid_year = (years != 0) & (years <= self.current_year)
+
+        # Age-adjusted normalization (see _normalize_citations_by_age)
+        thresholds = self._get_citation_thresholds_batch(self.current_year - years)
+        normalized = np.where(valid_year, np.minimum(citations / (thresholds * 2), 1.0), 0.0)
+
+        # Citation velocity bonus, using influential citations as proxy
+        has_velocity = (influential > 0) & (citations > 0)
+        velocity_bonus = np.where(
+            has_velocity,
+            np.minimum(influential / np.maximum(citations, 1) * 0.5, 0.3),
+            0.0
+        )
+
+        return np.minimum(0.7 * normalized + velocity_bonus, 1.0)
+
+    def _get_citation_thresholds_batch(self, years_old: np.ndarray) -> np.ndarray:
+        """Vectorized _get_citation_threshold"""
+        max_years, thresholds = zip(*sorted(config.CITATION_THRESHOLDS.items()))
+        thresholds = np.append(np.array(thresholds, dtype=float), config.CITATION_THRESHOLDS[100])
+        # First bucket with years_old <= max_years; past the last bucket uses the default
+        return thresholds[np.searchsorted(np.array(max_years), years_old, side='left')]
+
+    def _calculate_recency_scores_batch(self, papers: List[Dict]) -> np.ndarray:
+        """Vectorized _calculate_recency_score over a list of papers"""
+        years = np.array([p.get('year') or 0 for p in papers], dtype=float)
+        years_old = self.current_year - years
+
+        return np.select(
+            [years == 0, years_old < 0, years_old <= 1, years_old <= 3, years_old <= 5, years_old <= 10],
+            [0.3, 0.0, 1.0, 0.8, 0.6, 0.4],
+            default=0.2
+        )
 
     def _calculate_citation_score(self, paper: Dict) -> float:
         """Calculate citation-based score"""
@@ -236,8 +303,9 @@ class PaperQualityScorer:
     def rank_papers(self, papers: List[Dict]) -> List[Dict]:
         """Rank papers by quality score"""
         # Calculate scores
-        for paper in papers:
-            paper['quality_score'] = self.calculate_score(paper)
+        scores = self.calculate_scores_batch(papers)
+        for paper, score in zip(papers, scores):
+            paper['quality_score'] = float(score)
 
         # Sort by score (descending)
         ranked = sorted(papers, key=lambda x: x['quality_score'], reverse=True)
@@ -0,0 +1,99 @@
+"""
+LLM Response Cache
+==================
+
+Opt-in exact-match cache of agent LLM responses, meant for repeated test and
+development runs against the same papers. Set LLM_CACHE=1 to enable it.
+
+Responses are stored in SQLite at <project root>/.cache/llm_responses.db
+(override the directory with LLM_CACHE_DIR). Keys are SHA-256 digests of
+everything that determines the request (agent, model, prompts, sampling
+settings), so any change to the inputs is a miss.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache"
+CACHE_PATH = Path(os.environ.get("LLM_CACHE_DIR") or _DEFAULT_CACHE_DIR) / "llm_responses.db"
+
+# Each thread keeps its own connection (sqlite3 connections are not shareable
+# across threads); the schema is created once per database file
+_local = threading.local()
+_schema_lock = threading.Lock()
+_initialized_paths = set()
+
+
+def enabled() -> bool:
+    """Whether response caching is switched on (LLM_CACHE=1, default off)"""
+    return os.environ.get("LLM_CACHE", "0") == "1"
+
+
+def make_key(**parts) -> str:
+    """Hex SHA-256 over the request parts, independent of argument order"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _ensure_schema(path: Path):
+    with _schema_lock:
+        if path in _initialized_paths:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path))
+        try:
+            # WAL lets agents read while another thread writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        _initialized_paths.add(path)
+
+
+def _connection() -> sqlite3.Connection:
+    """This thread's connection to CACHE_PATH, opened on first use"""
+    path = CACHE_PATH
+    if getattr(_local, 'path', None) != path:
+        _ensure_schema(path)
+        if getattr(_local, 'conn', None) is not None:
+            _local.conn.close()
+        _local.conn = sqlite3.connect(str(path), timeout=30)
+        _local.path = path
+    return _local.conn
+
+
+def get(key: str) -> Optional[Dict]:
+    """Return the cached value for key, or None on a miss or read error"""
+    try:
+        row = _connection().execute(
+            "SELECT value FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.warning("LLM response cache read failed: %s", e)
+        return None
+
+
+def put(key: str, value: Dict) -> None:
+    """Store a JSON-serializable value under key (errors are logged, not raised)"""
+    try:
+        payload = json.dumps(value)
+        conn = _connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (key, payload)
+            )
+    except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+        logger.warning("LLM response cache write failed: %s", e)
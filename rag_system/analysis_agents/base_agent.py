@@ -8,9 +8,32 @@ Provides common functionality for Grok-4 integration and structured output.
 
 from typing import Dict, Optional
 import json
+import threading
 import time
 from openai import OpenAI
 import config
+from . import _response_cache
+
+# One Grok client (and connection pool) shared by all agents; the OpenAI client is thread-safe
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+# Bounds simultaneous Grok calls when the orchestrator runs agents in parallel
+_request_semaphore = threading.BoundedSemaphore(
+    config.GROK_SETTINGS.get('max_concurrent_requests', 11)
+)
+
+
+def get_shared_client() -> OpenAI:
+    """Return the process-wide Grok client, creating it on first use"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = OpenAI(
+                api_key=config.GROK_SETTINGS['api_key'],
+                base_url="https://api.x.ai/v1"
+            )
+    return _shared_client
 
 
 class BaseAnalysisAgent:
@@ -28,11 +51,8 @@ class BaseAnalysisAgent:
         self.section_name = section_name
         self.status = "initialized"
 
-        # Initialize Grok client
-        self.client = OpenAI(
-            api_key=config.GROK_SETTINGS['api_key'],
-            base_url="https://api.x.ai/v1"
-        )
+        # Grok client shared across agents
+        self.client = get_shared_client()
 
     def get_system_prompt(self) -> str:
         """
@@ -130,19 +150,47 @@ class BaseAnalysisAgent:
             system_prompt = self.get_system_prompt()
             user_prompt = self.get_user_prompt(section_text, paper_metadata)
 
-            # Call Grok-4
-            response = self.client.chat.completions.create(
-                model="grok-2-latest",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-
-            # Extract response
-            raw_response = response.choices[0].message.content
+            model = "grok-2-latest"
+
+            # With LLM_CACHE=1, identical requests reuse the stored response instead of calling Grok-4
+            cache_key = None
+            cached = None
+            if _response_cache.enabled():
+                cache_key = _response_cache.make_key(
+                    agent_name=self.agent_name,
+                    model=model,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                cached = _response_cache.get(cache_key)
+
+            if cached is not None:
+                raw_response = cached['raw_response']
+                tokens_used = cached.get('tokens_used')
+            else:
+                # Call Grok-4 (bounded by the shared concurrency limit)
+                with _request_semaphore:
+                    response = self.client.chat.completions.create(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt}
+                        ],
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    )
+
+                # Extract response
+                raw_response = response.choices[0].message.content
+                tokens_used = response.usage.total_tokens if hasattr(response, 'usage') else None
+
+                if cache_key is not None:
+                    _response_cache.put(cache_key, {
+                        'raw_response': raw_response,
+                        'tokens_used': tokens_used
+                    })
 
             # Parse response
             parsed_analysis = self.parse_response(raw_response)
@@ -157,7 +205,7 @@ class BaseAnalysisAgent:
                 'analysis': parsed_analysis,
                 'raw_response': raw_response,
                 'elapsed_time': elapsed_time,
-                'tokens_used': response.usage.total_tokens if hasattr(response, 'usage') else None,
+                'tokens_used': tokens_used,
                 'message': f'{self.section_name} analysis completed successfully'
             }
 
@@ -11,7 +11,7 @@ Enhanced with 4 new specialized content agents:
 """
 
 import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from rag_system.pdf_processor import PDFProcessor
 from rag_system.analysis_agents import (
@@ -41,12 +41,23 @@ class DocumentAnalysisOrchestrator:
     - 4 content-specific agents (References, Tables, Figures, Mathematics)
     """
 
-    def __init__(self):
-        """Initialize orchestrator with all 11 specialized agents."""
+    # Parallel runs: seconds allowed for all agents together, and for each agent
+    TOTAL_TIMEOUT = 300
+    AGENT_TIMEOUT = 60
+
+    def __init__(self, extraction_cache_dir: Optional[str] = None):
+        """
+        Initialize orchestrator with all 11 specialized agents.
+
+        Args:
+            extraction_cache_dir: Optional directory for persisting PDF section extraction
+                (keyed by PDF content hash); None disables the disk cache
+        """
         from rag_system.context_manager import ContextManager
 
         self.pdf_processor = PDFProcessor()
         self.context_manager = ContextManager()
+        self.extraction_cache_dir = extraction_cache_dir
 
         # Initialize all 11 specialized agents
         self.agents = {
@@ -194,6 +205,38 @@ class DocumentAnalysisOrchestrator:
         # If absolutely nothing is available, return a message
         return f"[No content available for {section_name} section]"
 
+    def extract_sections(self, pdf_path: str) -> Dict:
+        """
+        Parse a PDF into sections once, for reuse across analyze_paper() calls.
+
+        Uses the on-disk extraction cache when extraction_cache_dir is set.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Output of PDFProcessor.extract_text_by_sections, suitable for
+            analyze_paper(extraction_result=...)
+        """
+        if self.extraction_cache_dir:
+            from rag_system.pdf_processor_cache import load_or_extract_sections
+            return load_or_extract_sections(
+                pdf_path, self.pdf_processor, cache_dir=self.extraction_cache_dir
+            )
+        return self.pdf_processor.extract_text_by_sections(pdf_path)
+
+    @staticmethod
+    def _notify_agent_result(callback: Optional[Callable[[str, Dict], None]],
+                             agent_name: str, result: Dict) -> None:
+        """Pass a finished agent's result to the caller's callback, if any"""
+        if callback is None:
+            return
+        try:
+            callback(agent_name, result)
+        except Exception as e:
+            # A faulty callback must not turn a successful agent into a failure
+            print(f"  ⚠️  on_agent_result callback failed for {agent_name}: {e}")
+
     def analyze_section(self, agent_name: str, section_text: str,
                        paper_metadata: Dict) -> Dict:
         """
@@ -222,7 +265,9 @@ class DocumentAnalysisOrchestrator:
 
     def analyze_paper(self, pdf_path: str, paper_metadata: Optional[Dict] = None,
                      parallel: bool = True, max_workers: int = 11,
-                     enable_context_sharing: bool = False) -> Dict:
+                     enable_context_sharing: bool = False,
+                     extraction_result: Optional[Dict] = None,
+                     on_agent_result: Optional[Callable[[str, Dict], None]] = None) -> Dict:
         """
         Analyze research paper using all specialized agents.
 
@@ -232,6 +277,11 @@ class DocumentAnalysisOrchestrator:
             parallel: Whether to run agents in parallel (default: True)
             max_workers: Maximum number of parallel workers (default: 11)
             enable_context_sharing: Enable two-pass analysis with cross-sectional context (default: False)
+            extraction_result: Optional pre-computed output of PDFProcessor.extract_text_by_sections
+                for pdf_path (e.g. from extract_sections()); skips re-parsing the PDF
+            on_agent_result: Optional callback(agent_name, result) invoked as soon as each
+                agent finishes, fails or times out, so callers can consume partial results
+                before the run completes
 
         Returns:
             Comprehensive analysis dictionary with results from all agents
@@ -253,8 +303,11 @@ class DocumentAnalysisOrchestrator:
 
         try:
             # Step 1: Extract sections from PDF
-            print(f"📄 Extracting sections from PDF...")
-            extraction_result = self.pdf_processor.extract_text_by_sections(pdf_path)
+            if extraction_result is None:
+                print(f"📄 Extracting sections from PDF...")
+                extraction_result = self.extract_sections(pdf_path)
+            else:
+                print(f"📄 Using pre-extracted PDF sections...")
             sections = extraction_result.get('sections', {})
             pages = extraction_result.get('pages', [])
 
@@ -289,14 +342,15 @@ class DocumentAnalysisOrchestrator:
                     }
 
                     # Collect results as they complete with timeout protection
-                    # 300s (5 min) total timeout for all agents, 60s per agent
+                    # TOTAL_TIMEOUT (5 min) for all agents, AGENT_TIMEOUT (60s) per agent
                     try:
-                        for future in as_completed(future_to_agent, timeout=300):
+                        for future in as_completed(future_to_agent, timeout=self.TOTAL_TIMEOUT):
                             agent_name = future_to_agent[future]
                             try:
                                 # Per-agent timeout to prevent individual hangs
-                                result = future.result(timeout=60)
+                                result = future.result(timeout=self.AGENT_TIMEOUT)
                                 agent_results[agent_name] = result
+                                self._notify_agent_result(on_agent_result, agent_name, result)
 
                                 if result['success']:
                                     elapsed = result.get('elapsed_time', 0)
@@ -305,14 +359,15 @@ class DocumentAnalysisOrchestrator:
                                 else:
                                     print(f"  ❌ {agent_name}: {result.get('message', 'Failed')}")
                             except TimeoutError:
-                                print(f"  ⏱️  {agent_name}: Timeout after 60 seconds")
+                                print(f"  ⏱️  {agent_name}: Timeout after {self.AGENT_TIMEOUT} seconds")
                                 # Cancel the future to free resources
                                 future.cancel()
                                 agent_results[agent_name] = {
                                     'success': False,
                                     'agent_name': agent_name,
-                                    'error': 'Agent execution timed out after 60 seconds'
+                                    'error': f'Agent execution timed out after {self.AGENT_TIMEOUT} seconds'
                                 }
+                                self._notify_agent_result(on_agent_result, agent_name, agent_results[agent_name])
                             except Exception as e:
                                 print(f"  ❌ {agent_name}: Exception - {str(e)}")
                                 agent_results[agent_name] = {
@@ -320,19 +375,21 @@ class DocumentAnalysisOrchestrator:
                                     'agent_name': agent_name,
                                     'error': str(e)
                                 }
+                                self._notify_agent_result(on_agent_result, agent_name, agent_results[agent_name])
                     except TimeoutError:
                         # Handle case where not all agents complete within total timeout
-                        print("  ⏱️  Total timeout exceeded (300s) - some agents did not complete")
+                        print(f"  ⏱️  Total timeout exceeded ({self.TOTAL_TIMEOUT}s) - some agents did not complete")
                         # Cancel all incomplete futures and mark as timed out
-                        for agent_name, future in future_to_agent.items():
+                        for future, agent_name in future_to_agent.items():
                             if agent_name not in agent_results:
                                 # Cancel future to free resources
                                 future.cancel()
                                 agent_results[agent_name] = {
                                     'success': False,
                                     'agent_name': agent_name,
-                                    'error': 'Agent did not complete within total timeout (300s)'
+                                    'error': f'Agent did not complete within total timeout ({self.TOTAL_TIMEOUT}s)'
                                 }
+                                self._notify_agent_result(on_agent_result, agent_name, agent_results[agent_name])
             else:
                 # Sequential execution
                 print(f"\n⏳ Running {len(section_texts)} agents sequentially...")
@@ -340,6 +397,7 @@ class DocumentAnalysisOrchestrator:
                 for agent_name, section_text in section_texts.items():
                     result = self.analyze_section(agent_name, section_text, paper_metadata)
                     agent_results[agent_name] = result
+                    self._notify_agent_result(on_agent_result, agent_name, result)
 
                     if result['success']:
                         elapsed = result.get('elapsed_time', 0)
@@ -6,7 +6,7 @@ Manages SQLite database for storing document metadata, embeddings info, and chat
 """
 
 import sqlite3
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 import json
 from datetime import datetime
@@ -39,8 +39,19 @@ class RAGDatabase:
         if not hasattr(self._local, 'conn') or self._local.conn is None:
             self._local.conn = sqlite3.connect(str(self.db_path))
             self._local.conn.row_factory = sqlite3.Row
+            self._configure_connection(self._local.conn)
         return self._local.conn
 
+    @staticmethod
+    def _configure_connection(conn):
+        """Apply performance PRAGMAs to a new connection"""
+        # WAL lets readers proceed during writes; NORMAL sync is safe under WAL
+        # and avoids an fsync per commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+
     def _create_tables(self):
         """Create database tables if they don't exist"""
         conn = self._get_connection()
@@ -545,6 +556,11 @@ class RAGDatabase:
 
     # Statistics
 
+    def list_tables(self) -> Set[str]:
+        """Get the names of all tables in the database"""
+        conn = self._get_connection()
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
     def get_statistics(self) -> Dict:
         """Get database statistics"""
         conn = self._get_connection()
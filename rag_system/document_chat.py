@@ -95,21 +95,26 @@ class DocumentChatSystem:
         # Retrieve RAG results
         if use_rag:
             rag_results = self.rag_engine.query(question, document_id=document_id, top_k=top_k)
-            if rag_results and rag_results.get('chunks'):
-                context['has_rag_results'] = True
-                context['rag_context'] = {
-                    'relevant_chunks': [
-                        {
-                            'text': chunk['text'],
-                            'page': chunk.get('page_num', 'N/A'),
-                            'score': chunk.get('score', 0)
-                        }
-                        for chunk in rag_results['chunks']
-                    ]
-                }
+            self._add_rag_context(context, rag_results)
 
         return context
 
+    @staticmethod
+    def _add_rag_context(context: Dict, rag_results: Optional[Dict]):
+        """Attach RAGEngine query results (if any chunks matched) to a context"""
+        if rag_results and rag_results.get('chunks'):
+            context['has_rag_results'] = True
+            context['rag_context'] = {
+                'relevant_chunks': [
+                    {
+                        'text': chunk['text'],
+                        'page': chunk.get('page_num', 'N/A'),
+                        'score': chunk.get('score', 0)
+                    }
+                    for chunk in rag_results['chunks']
+                ]
+            }
+
     def _extract_methodology_summary(self, analysis: Dict) -> str:
         """Extract methodology summary from agent results"""
         try:
@@ -281,7 +286,102 @@ Year: {doc.get('year', 'N/A')}
                 use_analysis=use_analysis,
                 use_rag=use_rag
             )
+        except Exception as e:
+            return self._chat_error(e, start_time)
+
+        return self._answer(
+            document_id, question, context, use_analysis, use_rag,
+            temperature, max_tokens, save_to_history, start_time
+        )
 
+    def chat_batch(
+        self,
+        document_id: int,
+        questions: List[str],
+        use_analysis: bool = True,
+        use_rag: bool = True,
+        temperature: float = 0.3,
+        max_tokens: int = 1500,
+        save_to_history: bool = True
+    ) -> List[Dict]:
+        """
+        Answer several questions about the same document
+
+        The RAG search for all questions runs as one batched embedding + FAISS
+        query; each question then gets its own context and completion, as in
+        chat().
+
+        Args:
+            document_id: Document ID
+            questions: User questions
+            use_analysis: Use comprehensive analysis as context
+            use_rag: Use RAG search results as context
+            temperature: LLM temperature
+            max_tokens: Maximum response tokens
+            save_to_history: Save to chat history
+
+        Returns:
+            One chat() result dictionary per question, in order
+        """
+        if not questions:
+            return []
+
+        start_time = time.time()
+
+        try:
+            if use_rag:
+                rag_batch = self.rag_engine.query_batch(questions, document_id=document_id)
+            else:
+                rag_batch = [None] * len(questions)
+        except Exception as e:
+            return [self._chat_error(e, start_time) for _ in questions]
+
+        results = []
+        for question, rag_results in zip(questions, rag_batch):
+            start_time = time.time()
+            try:
+                context = self.get_document_context(
+                    document_id=document_id,
+                    question=question,
+                    use_analysis=use_analysis,
+                    use_rag=False
+                )
+                self._add_rag_context(context, rag_results)
+            except Exception as e:
+                results.append(self._chat_error(e, start_time))
+                continue
+
+            results.append(self._answer(
+                document_id, question, context, use_analysis, use_rag,
+                temperature, max_tokens, save_to_history, start_time
+            ))
+
+        return results
+
+    @staticmethod
+    def _chat_error(e: Exception, start_time: float) -> Dict:
+        """Failure result for a chat request that raised"""
+        return {
+            'success': False,
+            'error': str(e),
+            'message': f'Chat failed: {str(e)}',
+            'elapsed_time': time.time() - start_time
+        }
+
+    def _answer(
+        self,
+        document_id: int,
+        question: str,
+        context: Dict,
+        use_analysis: bool,
+        use_rag: bool,
+        temperature: float,
+        max_tokens: int,
+        save_to_history: bool,
+        start_time: float
+    ) -> Dict:
+        """Generate (and optionally save) the answer for a question given its context"""
+        try:
             # Check if we have any context
             if not context.get('has_analysis') and not context.get('has_rag_results'):
                 return {
@@ -349,12 +449,7 @@ Year: {doc.get('year', 'N/A')}
             }
 
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'message': f'Chat failed: {str(e)}',
-                'elapsed_time': time.time() - start_time
-            }
+            return self._chat_error(e, start_time)
 
     def get_chat_history(
         self,
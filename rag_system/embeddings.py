@@ -43,7 +43,8 @@ class EmbeddingsManager:
     def generate_embeddings(
         self,
         texts: List[str],
-        show_progress: bool = True
+        show_progress: bool = True,
+        batch_size: int = 32
     ) -> np.ndarray:
         """
         Generate embeddings for a list of texts
@@ -51,6 +52,7 @@ class EmbeddingsManager:
         Args:
             texts: List of text strings to embed
             show_progress: Show progress bar
+            batch_size: Number of texts per model forward pass
 
         Returns:
             numpy array of embeddings (shape: [n_texts, embedding_dim])
@@ -61,6 +63,7 @@ class EmbeddingsManager:
         # Generate embeddings
         embeddings = self.model.encode(
             texts,
+            batch_size=batch_size,
             show_progress_bar=show_progress,
             convert_to_numpy=True,
             normalize_embeddings=True  # L2 normalization for cosine similarity
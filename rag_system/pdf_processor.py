@@ -6,11 +6,69 @@ Extracts text from PDFs with page-level granularity using PyMuPDF (fitz).
 Maintains page numbers for accurate citation in Q&A.
 """
 
+import os
 import fitz  # PyMuPDF
 from typing import Dict, List, Optional
 from pathlib import Path
 import re
 
+# Common section headers in research papers, checked in order
+SECTION_PATTERNS = [
+    (r'abstract', 'abstract'),
+    (r'introduction', 'introduction'),
+    (r'related\s+work', 'related_work'),
+    (r'methodology', 'methodology'),
+    (r'methods?', 'methods'),
+    (r'experiments?', 'experiments'),
+    (r'results?', 'results'),
+    (r'discussion', 'discussion'),
+    (r'conclusion', 'conclusion'),
+    (r'references?', 'references'),
+]
+
+# One compiled alternation, so each line is tested with a single match call;
+# the named group that matched (lastgroup) is the section name
+_SECTION_HEADER_RE = re.compile(
+    r'^\s*(?:' + '|'.join(f'(?P<{name}>{pattern})' for pattern, name in SECTION_PATTERNS) + r')\s*$',
+    re.IGNORECASE
+)
+
+
+# A complete PDF ends with %%EOF. The spec puts it in the last 1024 bytes, but
+# real files often carry trailing junk (padding, appended signatures), so the
+# search covers a wider tail
+_EOF_MARKER = b'%%EOF'
+_EOF_WINDOW = 64 * 1024
+
+
+def has_eof_marker(pdf_path: str) -> bool:
+    """
+    Check that a file ends like a complete PDF, without opening it in MuPDF
+
+    Truncated downloads lack the trailing %%EOF marker; rejecting them up
+    front avoids allocating a MuPDF document just to fail on it.
+
+    Raises:
+        OSError: If the file cannot be read (e.g. it does not exist)
+    """
+    with open(pdf_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _EOF_WINDOW:
+            f.seek(-_EOF_WINDOW, os.SEEK_END)
+        return _EOF_MARKER in f.read()
+
+
+def _open_pdf(pdf_path: str) -> fitz.Document:
+    """
+    Open a PDF with MuPDF, rejecting truncated files first
+
+    Raises:
+        ValueError: If the file has no %%EOF marker near its end
+        OSError: If the file cannot be read
+    """
+    if not has_eof_marker(pdf_path):
+        raise ValueError(f"Incomplete PDF (no %%EOF marker): {pdf_path}")
+    return fitz.open(pdf_path)
+
 
 class PDFProcessor:
     """Processes PDF files and extracts text with metadata"""
@@ -39,8 +97,8 @@ class PDFProcessor:
         """
         doc = None
         try:
-            # Open PDF
-            doc = fitz.open(pdf_path)
+            # Open PDF (truncated files are rejected before MuPDF sees them)
+            doc = _open_pdf(pdf_path)
 
             # Extract metadata
             metadata = {
@@ -155,41 +213,24 @@ class PDFProcessor:
 
         full_text = result['full_text']
 
-        # Common section headers in research papers
-        section_patterns = [
-            (r'(?i)^\s*abstract\s*$', 'abstract'),
-            (r'(?i)^\s*introduction\s*$', 'introduction'),
-            (r'(?i)^\s*related\s+work\s*$', 'related_work'),
-            (r'(?i)^\s*methodology\s*$', 'methodology'),
-            (r'(?i)^\s*methods?\s*$', 'methods'),
-            (r'(?i)^\s*experiments?\s*$', 'experiments'),
-            (r'(?i)^\s*results?\s*$', 'results'),
-            (r'(?i)^\s*discussion\s*$', 'discussion'),
-            (r'(?i)^\s*conclusion\s*$', 'conclusion'),
-            (r'(?i)^\s*references?\s*$', 'references'),
-        ]
-
         sections = {}
 
         # Try to identify sections (basic implementation)
         lines = full_text.split('\n')
         current_section = 'header'
         current_text = []
+        match_header = _SECTION_HEADER_RE.match
 
         for line in lines:
-            matched = False
-            for pattern, section_name in section_patterns:
-                if re.match(pattern, line):
-                    # Save previous section
-                    if current_text:
-                        sections[current_section] = '\n'.join(current_text)
-                    # Start new section
-                    current_section = section_name
-                    current_text = []
-                    matched = True
-                    break
-
-            if not matched:
+            header = match_header(line)
+            if header:
+                # Save previous section
+                if current_text:
+                    sections[current_section] = '\n'.join(current_text)
+                # Start new section
+                current_section = header.lastgroup
+                current_text = []
+            else:
                 current_text.append(line)
 
         # Save last section
@@ -212,7 +253,7 @@ class PDFProcessor:
         """
         doc = None
         try:
-            doc = fitz.open(pdf_path)
+            doc = _open_pdf(pdf_path)
 
             if page_number < 1 or page_number > len(doc):
                 return None
@@ -245,7 +286,7 @@ class PDFProcessor:
         """
         doc = None
         try:
-            doc = fitz.open(pdf_path)
+            doc = _open_pdf(pdf_path)
             count = len(doc)
             return count
         except Exception as e:
@@ -271,7 +312,7 @@ class PDFProcessor:
         """
         doc = None
         try:
-            doc = fitz.open(pdf_path)
+            doc = _open_pdf(pdf_path)
             images_info = []
 
             for page_num in range(len(doc)):
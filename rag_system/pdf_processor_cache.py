@@ -0,0 +1,86 @@
+"""
+PDF Extraction Cache
+====================
+
+Persists PDFProcessor.extract_text_by_sections() results on disk, keyed by the
+SHA-256 of the PDF bytes, so repeated analyses of the same file skip parsing.
+extract_cached() adds an in-process layer for callers that parse the same file
+several times in one session (e.g. the agent tests).
+"""
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from rag_system.pdf_processor import PDFProcessor
+
+# Bump when PDFProcessor's extraction output changes so stale entries are ignored
+CACHE_VERSION = 1
+# Anchored at the project root, so the location does not depend on the working directory
+DEFAULT_CACHE_DIR = str(Path(__file__).resolve().parent.parent / ".cache" / "pdf_sections")
+
+
+def file_sha256(pdf_path: str) -> str:
+    """Hex SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_or_extract_sections(
+    pdf_path: str,
+    processor: Optional[PDFProcessor] = None,
+    cache_dir: str = DEFAULT_CACHE_DIR
+) -> Dict:
+    """
+    Return the section extraction for a PDF, from disk cache when available
+
+    Args:
+        pdf_path: Path to PDF file
+        processor: PDFProcessor to use on a cache miss (created if None)
+        cache_dir: Directory holding cached extraction results
+
+    Returns:
+        Same dictionary as PDFProcessor.extract_text_by_sections()
+    """
+    cache_path = Path(cache_dir) / f"{file_sha256(pdf_path)}_v{CACHE_VERSION}.json"
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            # Corrupt or unreadable entry - fall through and re-extract
+            print(f"Warning: Ignoring unreadable PDF cache entry {cache_path}: {e}")
+
+    result = (processor or PDFProcessor()).extract_text_by_sections(pdf_path)
+
+    # Only cache successful extractions; failures may be transient
+    if result.get('success'):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write PDF cache entry {cache_path}: {e}")
+
+    return result
+
+
+@functools.lru_cache(maxsize=8)
+def extract_cached(pdf_path: str, mtime_ns: int) -> Dict:
+    """
+    In-memory memo of PDFProcessor.extract_text_by_sections()
+
+    mtime_ns is part of the key so an edited file is re-parsed; pass
+    Path(pdf_path).stat().st_mtime_ns. The returned dict is shared between
+    callers and must be treated as read-only.
+    """
+    return PDFProcessor().extract_text_by_sections(pdf_path)
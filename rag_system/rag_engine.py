@@ -233,64 +233,93 @@ class RAGEngine:
         Returns:
             Dictionary with search results
         """
+        return self.query_batch([query_text], document_id=document_id, top_k=top_k)[0]
+
+    def query_batch(
+        self,
+        query_texts: List[str],
+        document_id: Optional[int] = None,
+        top_k: int = 5
+    ) -> List[Dict]:
+        """
+        Query for relevant chunks for several queries at once
+
+        All queries are embedded in one model call and searched against the
+        FAISS index as a single query matrix.
+
+        Args:
+            query_texts: Search queries
+            document_id: Optional document ID to search within
+            top_k: Number of results to return per query
+
+        Returns:
+            One result dictionary per query, in order, shaped like query()'s
+        """
         start_time = time.time()
 
+        def failed(error: str) -> List[Dict]:
+            elapsed_time = time.time() - start_time
+            return [
+                {'success': False, 'error': error, 'elapsed_time': elapsed_time}
+                for _ in query_texts
+            ]
+
+        if not query_texts:
+            return []
+
         try:
-            if document_id:
-                # Search within specific document
-                if not self.load_index(document_id):
-                    return {
-                        'success': False,
-                        'error': f'Index not found for document {document_id}',
-                        'elapsed_time': time.time() - start_time
-                    }
-
-                index_data = self.indexes[document_id]
-                index = index_data['index']
-                chunk_ids = index_data['chunk_ids']
-
-                # Generate query embedding
-                query_embedding = self.embedding_model.generate_embeddings([query_text], show_progress=False)
-
-                # Search FAISS index
-                distances, indices = index.search(query_embedding.astype('float32'), top_k)
-
-                # Retrieve chunks from database
+            if not document_id:
+                # Search across all documents (not implemented yet)
+                return failed('Cross-document search not yet implemented')
+
+            # Search within specific document
+            if not self.load_index(document_id):
+                return failed(f'Index not found for document {document_id}')
+
+            index_data = self.indexes[document_id]
+            index = index_data['index']
+            chunk_ids = index_data['chunk_ids']
+
+            # Generate query embeddings in one batch
+            query_embeddings = self.embedding_model.generate_embeddings(
+                list(query_texts),
+                show_progress=False,
+                batch_size=len(query_texts)
+            )
+
+            # Search FAISS index (one row of results per query)
+            distances, indices = index.search(query_embeddings.astype('float32'), top_k)
+
+            # Retrieve chunks from database, once per chunk across all queries
+            fetched = {}
+            results = []
+            for row, query_text in enumerate(query_texts):
                 chunks = []
-                for i, idx in enumerate(indices[0]):
+                for i, idx in enumerate(indices[row]):
                     if idx >= 0 and idx < len(chunk_ids):
                         chunk_id = chunk_ids[idx]
-                        chunk = self.db.get_chunk_by_id(chunk_id)
+                        if chunk_id not in fetched:
+                            fetched[chunk_id] = self.db.get_chunk_by_id(chunk_id)
+                        chunk = fetched[chunk_id]
 
                         if chunk:
-                            chunk['score'] = float(1 / (1 + distances[0][i]))  # Convert distance to score
+                            chunk = dict(chunk)
+                            chunk['score'] = float(1 / (1 + distances[row][i]))  # Convert distance to score
                             chunks.append(chunk)
 
-                elapsed_time = time.time() - start_time
-
-                return {
+                results.append({
                     'success': True,
                     'query': query_text,
                     'document_id': document_id,
                     'chunks': chunks,
                     'num_results': len(chunks),
-                    'elapsed_time': elapsed_time
-                }
-
-            else:
-                # Search across all documents (not implemented yet)
-                return {
-                    'success': False,
-                    'error': 'Cross-document search not yet implemented',
                     'elapsed_time': time.time() - start_time
-                }
+                })
+
+            return results
 
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'elapsed_time': time.time() - start_time
-            }
+            return failed(str(e))
 
     def get_document_stats(self, document_id: int) -> Dict:
         """
@@ -8,7 +8,9 @@ sys.path.append('.')
 
 import time
 from rag_system.analysis_agents.orchestrator import DocumentAnalysisOrchestrator
+import pytest
 
+@pytest.mark.integration
 def test_7_agents():
     """Test that all 7 agents run successfully on a sample paper"""
 
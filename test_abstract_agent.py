@@ -8,8 +8,13 @@ Validates the quality and completeness of the abstract analysis.
 
 import sys
 import json
+from textwrap import fill
 from rag_system.pdf_processor import PDFProcessor
 from rag_system.analysis_agents.abstract_agent import AbstractAgent
+import pytest
+
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
 
 def test_abstract_agent():
@@ -179,16 +184,7 @@ def test_abstract_agent():
         print("-" * 80)
         critical_analysis = analysis.get('critical_analysis', 'Not provided')
         # Wrap text at 80 characters
-        words = critical_analysis.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(critical_analysis, width=80))
 
         print("\n" + "=" * 80)
         print("✅ ABSTRACTAGENT TEST PASSED!")
@@ -5,8 +5,13 @@ Test ConclusionAgent with Transformer Paper
 
 import sys
 import json
+from textwrap import fill
 from rag_system.pdf_processor import PDFProcessor
 from rag_system.analysis_agents.conclusion_agent import ConclusionAgent
+import pytest
+
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
 
 def test_conclusion_agent():
@@ -120,16 +125,7 @@ def test_conclusion_agent():
         print("\n🌍 BROADER IMPACT:")
         print("-" * 80)
         impact = analysis.get('broader_impact', 'Not discussed')
-        words = impact.split()
-        line = ""
-        for word in words[:100]:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(' '.join(impact.split()[:100]), width=80))
 
         print("\n📊 CONCLUSION QUALITY:")
         print("-" * 80)
@@ -141,16 +137,7 @@ def test_conclusion_agent():
         print("\n🔍 CRITICAL ANALYSIS:")
         print("-" * 80)
         critical = analysis.get('critical_analysis', 'Not provided')
-        words = critical.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(critical, width=80))
 
         print("\n" + "=" * 80)
         print("✅ CONCLUSIONAGENT TEST PASSED!")
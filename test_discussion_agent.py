@@ -5,8 +5,13 @@ Test DiscussionAgent with Transformer Paper
 
 import sys
 import json
+from textwrap import fill
 from rag_system.pdf_processor import PDFProcessor
 from rag_system.analysis_agents.discussion_agent import DiscussionAgent
+import pytest
+
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
 
 def test_discussion_agent():
@@ -82,16 +87,7 @@ def test_discussion_agent():
         print("\n💭 RESULTS INTERPRETATION:")
         print("-" * 80)
         interpretation = analysis.get('results_interpretation', 'Not found')
-        words = interpretation.split()
-        line = ""
-        for word in words[:100]:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(' '.join(interpretation.split()[:100]), width=80))
 
         print("\n🔬 THEORETICAL IMPLICATIONS:")
         print("-" * 80)
@@ -123,16 +119,7 @@ def test_discussion_agent():
         print("\n🔍 GENERALIZABILITY:")
         print("-" * 80)
         generalizability = analysis.get('generalizability', 'Not discussed')
-        words = generalizability.split()
-        line = ""
-        for word in words[:100]:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(' '.join(generalizability.split()[:100]), width=80))
 
         print("\n📊 DISCUSSION QUALITY:")
         print("-" * 80)
@@ -144,16 +131,7 @@ def test_discussion_agent():
         print("\n🔍 CRITICAL ANALYSIS:")
         print("-" * 80)
         critical = analysis.get('critical_analysis', 'Not provided')
-        words = critical.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(critical, width=80))
 
         print("\n" + "=" * 80)
         print("✅ DISCUSSIONAGENT TEST PASSED!")
@@ -0,0 +1,138 @@
+"""
+Tests for batched retrieval and chat (RAGEngine.query_batch and
+DocumentChatSystem.chat_batch) against their one-at-a-time counterparts
+
+Embeddings and the LLM are stubbed, so no model is loaded and no request
+leaves the process.
+"""
+
+import zlib
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+# Both modules pull in the RAG stack (openai, sentence_transformers, tiktoken,
+# llama_index) at import time; skip when any of it is missing
+rag_engine = pytest.importorskip("rag_system.rag_engine")
+document_chat = pytest.importorskip("rag_system.document_chat")
+
+from rag_system.database import RAGDatabase
+
+CHUNKS = [
+    ("Transformers rely on self-attention to model long-range dependencies.", 1),
+    ("We train the model on a large corpus of scientific abstracts.", 2),
+    ("Results show a 12 percent improvement in retrieval accuracy.", 3),
+    ("Limitations include the cost of attention on long documents.", 4),
+    ("Future work will explore sparse attention and retrieval at scale.", 5),
+]
+
+QUESTIONS = [
+    "How does self-attention work?",
+    "What data was the model trained on?",
+    "How much did retrieval accuracy improve?",
+    "What are the limitations?",
+]
+
+
+class StubEmbeddings:
+    """Deterministic bag-of-words hashing in place of the sentence-transformer"""
+
+    dimension = 64
+
+    def generate_embeddings(self, texts, show_progress=False, batch_size=32):
+        vectors = np.zeros((len(texts), self.dimension), dtype='float32')
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, zlib.crc32(word.strip('.,?').encode()) % self.dimension] += 1.0
+        return vectors
+
+
+class StubCompletions:
+    """Stand-in for client.chat.completions that answers with the user prompt"""
+
+    def create(self, messages, **kwargs):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=messages[-1]['content']))],
+            usage=SimpleNamespace(total_tokens=1)
+        )
+
+
+@pytest.fixture
+def document(tmp_path, monkeypatch):
+    """A database holding one indexed document, and its ID"""
+    monkeypatch.setattr(rag_engine, "EmbeddingsManager", StubEmbeddings)
+    monkeypatch.setattr(
+        document_chat, "OpenAI",
+        lambda **kwargs: SimpleNamespace(chat=SimpleNamespace(completions=StubCompletions()))
+    )
+
+    db = RAGDatabase(str(tmp_path / "rag_documents.db"))
+    doc_id = db.add_document(doi="10.0000/test", title="Attention Test Paper", authors=["A. Author"])
+    chunk_ids = [db.add_chunk(doc_id, text, page_num=page) for text, page in CHUNKS]
+
+    embeddings = StubEmbeddings().generate_embeddings([text for text, _ in CHUNKS])
+    index = faiss.IndexFlatL2(embeddings.shape[1])
+    index.add(embeddings)
+    indexed = {'index': index, 'chunk_ids': chunk_ids, 'dimension': embeddings.shape[1]}
+
+    yield db, doc_id, indexed
+    db.close()
+
+
+def _engine(db, doc_id, indexed):
+    engine = rag_engine.RAGEngine(db=db)
+    engine.indexes[doc_id] = indexed
+    return engine
+
+
+def test_query_batch_matches_query(document):
+    """Each query_batch() result equals query() for the same question"""
+    db, doc_id, indexed = document
+    engine = _engine(db, doc_id, indexed)
+
+    batch = engine.query_batch(QUESTIONS, document_id=doc_id, top_k=3)
+    assert len(batch) == len(QUESTIONS)
+
+    for question, batched in zip(QUESTIONS, batch):
+        single = engine.query(question, document_id=doc_id, top_k=3)
+        assert batched['success'] and single['success']
+        assert batched['query'] == question
+        assert [c['id'] for c in batched['chunks']] == [c['id'] for c in single['chunks']]
+        assert [c['score'] for c in batched['chunks']] == pytest.approx([c['score'] for c in single['chunks']])
+        assert batched['num_results'] == single['num_results'] == 3
+
+
+def test_query_batch_failures(document):
+    """Empty input gives no results; a missing index fails every query"""
+    db, doc_id, indexed = document
+    engine = _engine(db, doc_id, indexed)
+
+    assert engine.query_batch([], document_id=doc_id) == []
+
+    missing = engine.query_batch(QUESTIONS[:2], document_id=doc_id + 1)
+    assert len(missing) == 2
+    assert all(not r['success'] and 'Index not found' in r['error'] for r in missing)
+    assert not engine.query(QUESTIONS[0], document_id=doc_id + 1)['success']
+
+
+def test_chat_batch_matches_chat(document):
+    """chat_batch() answers each question exactly as chat() does in a loop"""
+    db, doc_id, indexed = document
+    chat = document_chat.DocumentChatSystem(db=db)
+    chat.rag_engine.indexes[doc_id] = indexed
+
+    batch = chat.chat_batch(doc_id, QUESTIONS, save_to_history=False)
+    singles = [chat.chat(doc_id, q, save_to_history=False) for q in QUESTIONS]
+
+    assert len(batch) == len(QUESTIONS)
+    for question, batched, single in zip(QUESTIONS, batch, singles):
+        assert batched['success'] and single['success']
+        assert batched['question'] == question
+        assert batched['context_used']['has_rag']
+        # The stub answers with the user prompt, so equal answers mean equal contexts
+        assert question in batched['answer']
+        assert batched['answer'] == single['answer']
+        assert batched['sources_used'] == single['sources_used']
+        assert batched['context_used'] == single['context_used']
@@ -5,45 +5,78 @@ Tests all features of the Research Paper Discovery System
 """
 
 import time
+import statistics
 import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
-# Test results tracking
-test_results = []
-total_tests = 0
-passed_tests = 0
-failed_tests = 0
+import pytest
+
+from testing_support import stdout_can_encode
+
+
+@dataclass
+class TestStats:
+    """Pass/fail counters and per-test results for one test-runner invocation"""
+    __test__ = False  # not a pytest test class
+
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    results: list = field(default_factory=list)
+
+    def record(self, test_name, status, message="", time_taken=None, category=None):
+        """Count one test outcome and keep its details for the summary"""
+        self.total += 1
+        if status:
+            self.passed += 1
+        else:
+            self.failed += 1
+
+        self.results.append({
+            'test': test_name,
+            'status': status,
+            'message': message,
+            'time': time_taken,
+            'category': category
+        })
+
+
+# Emoji only when stdout can encode them; plain ASCII markers otherwise
+_USE_EMOJI = stdout_can_encode("✅❌🎉⚠️")
+PASS_MARK = "✅" if _USE_EMOJI else "[OK]"
+FAIL_MARK = "❌" if _USE_EMOJI else "[X]"
+PARTY_MARK = "🎉" if _USE_EMOJI else "[OK]"
+WARN_MARK = "⚠️ " if _USE_EMOJI else "[!]"
+
+# Test results tracking (replaced with a fresh instance by run_all_tests)
+stats = TestStats()
+
+# Chunking corpus is read from disk once and reused; timed runs after warmup
+_chunking_corpus = None
+CHUNKING_RUNS = 5
 
 def print_header(text):
     print(f"\n{'='*80}")
     print(f"{text}")
     print(f"{'='*80}\n")
 
-def print_test(test_name, status, message="", time_taken=None):
-    global total_tests, passed_tests, failed_tests
-    total_tests += 1
+def print_test(test_name, status, message="", time_taken=None, category=None):
+    stats.record(test_name, status, message, time_taken, category)
 
     if status:
-        passed_tests += 1
-        emoji = "✅"
+        emoji = PASS_MARK
         status_text = "PASS"
     else:
-        failed_tests += 1
-        emoji = "❌"
+        emoji = FAIL_MARK
         status_text = "FAIL"
 
-    time_str = f" ({time_taken:.2f}s)" if time_taken else ""
+    time_str = "" if time_taken is None else f" ({time_taken:.2f}s)"
     print(f"{emoji} {status_text} - {test_name}{time_str}")
     if message:
         print(f"    {message}")
 
-    test_results.append({
-        'test': test_name,
-        'status': status,
-        'message': message,
-        'time': time_taken
-    })
-
 def test_imports():
     """Test 1: Verify all imports work"""
     print_header("TEST CATEGORY 1: IMPORTS & DEPENDENCIES")
@@ -82,35 +115,34 @@ def test_database():
     try:
         from rag_system.database import RAGDatabase
 
-        start = time.time()
+        start = time.perf_counter()
         db = RAGDatabase()
-        elapsed = time.time() - start
-        print_test("Database Initialization", True, time_taken=elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("Database Initialization", True, time_taken=elapsed, category='Database')
 
         # Test tables exist
-        cursor = db.conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = [row[0] for row in cursor.fetchall()]
+        tables = db.list_tables()
 
         required_tables = ['documents', 'document_chunks', 'document_analyses', 'chat_history']
         missing = [t for t in required_tables if t not in tables]
 
         if not missing:
-            print_test("Database Schema Complete", True, f"All {len(required_tables)} tables present")
+            print_test("Database Schema Complete", True, f"All {len(required_tables)} tables present", category='Database')
         else:
-            print_test("Database Schema Complete", False, f"Missing tables: {missing}")
+            print_test("Database Schema Complete", False, f"Missing tables: {missing}", category='Database')
 
         # Test statistics
         stats = db.get_analysis_statistics()
-        print_test("Get Analysis Statistics", True, f"Total analyses: {stats.get('total_analyses', 0)}")
+        print_test("Get Analysis Statistics", True, f"Total analyses: {stats.get('total_analyses', 0)}", category='Database')
 
         # Test document count
         docs = db.list_documents(limit=5)
-        print_test("List Documents", True, f"Found {len(docs)} documents")
+        print_test("List Documents", True, f"Found {len(docs)} documents", category='Database')
 
     except Exception as e:
-        print_test("Database Operations", False, str(e))
+        print_test("Database Operations", False, str(e), category='Database')
 
+@pytest.mark.usefixtures("warm_embeddings")
 def test_rag_engine():
     """Test 3: RAG Engine"""
     print_header("TEST CATEGORY 3: RAG ENGINE")
@@ -118,24 +150,30 @@ def test_rag_engine():
     try:
         from rag_system.rag_engine import RAGEngine
 
-        start = time.time()
+        start = time.perf_counter()
         engine = RAGEngine()
-        elapsed = time.time() - start
-        print_test("RAG Engine Initialization", True, f"Embedding dim: {engine.embedding_model.embedding_dim}", elapsed)
-
-        # Test embedding generation
-        start = time.time()
-        test_texts = ["This is a test sentence", "Another test sentence"]
-        embeddings = engine.embedding_model.generate_embeddings(test_texts, show_progress=False)
-        elapsed = time.time() - start
-
-        if embeddings.shape[0] == 2 and embeddings.shape[1] == 384:
-            print_test("Embedding Generation", True, f"Shape: {embeddings.shape}", elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("RAG Engine Initialization", True, f"Embedding dim: {engine.embedding_model.embedding_dim}", elapsed, category='RAG')
+
+        # Test embedding generation at a realistic batch size so the timing reflects
+        # model throughput rather than per-call dispatch overhead
+        batch_size = 64
+        test_texts = ["This is a test sentence", "Another test sentence"] * (batch_size // 2)
+        start = time.perf_counter()
+        embeddings = engine.embedding_model.generate_embeddings(
+            test_texts, show_progress=False, batch_size=batch_size
+        )
+        elapsed = time.perf_counter() - start
+
+        if embeddings.shape[0] == len(test_texts) and embeddings.shape[1] == 384:
+            print_test("Embedding Generation", True,
+                      f"Shape: {embeddings.shape}, {elapsed / len(test_texts) * 1000:.2f}ms per sentence",
+                      elapsed, category='RAG')
         else:
-            print_test("Embedding Generation", False, f"Wrong shape: {embeddings.shape}")
+            print_test("Embedding Generation", False, f"Wrong shape: {embeddings.shape}", category='RAG')
 
     except Exception as e:
-        print_test("RAG Engine", False, str(e))
+        print_test("RAG Engine", False, str(e), category='RAG')
 
 def test_multi_agent_system():
     """Test 4: Multi-Agent Analysis"""
@@ -145,10 +183,10 @@ def test_multi_agent_system():
         from rag_system.analysis_agents import DocumentAnalysisOrchestrator, SynthesisAgent
 
         # Test orchestrator initialization
-        start = time.time()
+        start = time.perf_counter()
         orchestrator = DocumentAnalysisOrchestrator()
-        elapsed = time.time() - start
-        print_test("Orchestrator Initialization", True, f"7 agents loaded", elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("Orchestrator Initialization", True, f"7 agents loaded", elapsed, category='Agent')
 
         # Verify all agents present
         expected_agents = ['abstract', 'introduction', 'literature_review', 'methodology',
@@ -156,18 +194,18 @@ def test_multi_agent_system():
         missing_agents = [a for a in expected_agents if a not in orchestrator.agents]
 
         if not missing_agents:
-            print_test("All 7 Agents Present", True)
+            print_test("All 7 Agents Present", True, category='Agent')
         else:
-            print_test("All 7 Agents Present", False, f"Missing: {missing_agents}")
+            print_test("All 7 Agents Present", False, f"Missing: {missing_agents}", category='Agent')
 
         # Test synthesis agent
-        start = time.time()
+        start = time.perf_counter()
         synthesizer = SynthesisAgent()
-        elapsed = time.time() - start
-        print_test("Synthesis Agent Initialization", True, time_taken=elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("Synthesis Agent Initialization", True, time_taken=elapsed, category='Agent')
 
     except Exception as e:
-        print_test("Multi-Agent System", False, str(e))
+        print_test("Multi-Agent System", False, str(e), category='Agent')
 
 def test_document_chat():
     """Test 5: Document Chat System"""
@@ -176,20 +214,20 @@ def test_document_chat():
     try:
         from rag_system.document_chat import DocumentChatSystem
 
-        start = time.time()
+        start = time.perf_counter()
         chat_system = DocumentChatSystem()
-        elapsed = time.time() - start
-        print_test("Chat System Initialization", True, time_taken=elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("Chat System Initialization", True, time_taken=elapsed, category='Chat')
 
         # Test prompts
         system_prompt = chat_system.build_system_prompt()
         if len(system_prompt) > 100:
-            print_test("Build System Prompt", True, f"Length: {len(system_prompt)} chars")
+            print_test("Build System Prompt", True, f"Length: {len(system_prompt)} chars", category='Chat')
         else:
-            print_test("Build System Prompt", False, "Prompt too short")
+            print_test("Build System Prompt", False, "Prompt too short", category='Chat')
 
     except Exception as e:
-        print_test("Document Chat System", False, str(e))
+        print_test("Document Chat System", False, str(e), category='Chat')
 
 def test_workflow_manager():
     """Test 6: Workflow Manager"""
@@ -198,21 +236,21 @@ def test_workflow_manager():
     try:
         from rag_system.paper_analysis_workflow import PaperAnalysisWorkflow
 
-        start = time.time()
+        start = time.perf_counter()
         workflow = PaperAnalysisWorkflow()
-        elapsed = time.time() - start
-        print_test("Workflow Manager Initialization", True, time_taken=elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("Workflow Manager Initialization", True, time_taken=elapsed, category='Workflow')
 
         # Test statistics
         stats = workflow.get_analysis_statistics()
-        print_test("Get Statistics", True, f"Total analyses: {stats.get('total_analyses', 0)}")
+        print_test("Get Statistics", True, f"Total analyses: {stats.get('total_analyses', 0)}", category='Workflow')
 
         # Test list analyses
         analyses = workflow.list_analyzed_papers(limit=10)
-        print_test("List Analyzed Papers", True, f"Found {len(analyses)} papers")
+        print_test("List Analyzed Papers", True, f"Found {len(analyses)} papers", category='Workflow')
 
     except Exception as e:
-        print_test("Workflow Manager", False, str(e))
+        print_test("Workflow Manager", False, str(e), category='Workflow')
 
 def test_pdf_processing():
     """Test 7: PDF Processing"""
@@ -222,37 +260,49 @@ def test_pdf_processing():
         from rag_system.pdf_processor import PDFProcessor
         from rag_system.pdf_downloader import PDFDownloader
 
-        start = time.time()
+        start = time.perf_counter()
         processor = PDFProcessor()
-        elapsed = time.time() - start
-        print_test("PDF Processor Initialization", True, time_taken=elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("PDF Processor Initialization", True, time_taken=elapsed, category='PDF')
 
-        start = time.time()
+        start = time.perf_counter()
         downloader = PDFDownloader()
-        elapsed = time.time() - start
-        print_test("PDF Downloader Initialization", True, time_taken=elapsed)
+        elapsed = time.perf_counter() - start
+        print_test("PDF Downloader Initialization", True, time_taken=elapsed, category='PDF')
 
         # Check if transformer paper exists
         pdf_path = "documents/8277bf0bb00823cca9b6ba58b7f42c48.pdf"
         if Path(pdf_path).exists():
-            print_test("Sample PDF Available", True, pdf_path)
+            print_test("Sample PDF Available", True, pdf_path, category='PDF')
 
             # Test text extraction (use correct method name: extract_text_from_pdf)
-            start = time.time()
+            start = time.perf_counter()
             result = processor.extract_text_from_pdf(pdf_path)
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
 
             if result['success']:
                 print_test("PDF Text Extraction", True,
-                          f"{len(result['full_text'])} chars, {len(result.get('pages', []))} pages", elapsed)
+                          f"{len(result['full_text'])} chars, {len(result.get('pages', []))} pages", elapsed, category='PDF')
             else:
-                print_test("PDF Text Extraction", False, result.get('message', 'Unknown error'))
+                print_test("PDF Text Extraction", False, result.get('message', 'Unknown error'), category='PDF')
         else:
-            print_test("Sample PDF Available", False, "No test PDF found")
+            print_test("Sample PDF Available", False, "No test PDF found", category='PDF')
 
     except Exception as e:
-        print_test("PDF Processing", False, str(e))
+        print_test("PDF Processing", False, str(e), category='PDF')
+
+def load_chunking_corpus():
+    """Load the chunking corpus once: real paper metadata files, or filler text if absent"""
+    global _chunking_corpus
+    if _chunking_corpus is None:
+        files = sorted(Path("papers_metadata").glob("*.txt"))
+        if files:
+            _chunking_corpus = "\n\n".join(f.read_text(encoding="utf-8") for f in files)
+        else:
+            _chunking_corpus = "This is a test. " * 100
+    return _chunking_corpus
 
+@pytest.mark.usefixtures("warm_chunker")
 def test_text_chunking():
     """Test 8: Text Chunking"""
     print_header("TEST CATEGORY 8: TEXT CHUNKING")
@@ -260,19 +310,32 @@ def test_text_chunking():
     try:
         from rag_system.text_chunker import TextChunker
 
-        start = time.time()
+        start = time.perf_counter()
         chunker = TextChunker()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         print_test("Text Chunker Initialization", True, time_taken=elapsed)
 
         # Test chunking (use correct method name: chunk_document)
-        test_text = "This is a test. " * 100  # Create long text
-        start = time.time()
+        test_text = load_chunking_corpus()
+
+        # First call pays tokenizer/splitter warmup; report it separately
+        start = time.perf_counter()
         chunks = chunker.chunk_document(test_text)
-        elapsed = time.time() - start
+        warmup_time = time.perf_counter() - start
+
+        # Steady-state cost is the median of repeated runs
+        run_times = []
+        for _ in range(CHUNKING_RUNS):
+            start = time.perf_counter()
+            chunker.chunk_document(test_text)
+            run_times.append(time.perf_counter() - start)
+        steady_time = statistics.median(run_times)
 
         if len(chunks) > 0:
-            print_test("Text Chunking", True, f"Created {len(chunks)} chunks", elapsed)
+            print_test("Text Chunking", True,
+                      f"Created {len(chunks)} chunks from {len(test_text):,} chars "
+                      f"(warmup {warmup_time:.3f}s, steady median {steady_time:.3f}s)",
+                      steady_time)
         else:
             print_test("Text Chunking", False, "No chunks created")
 
@@ -284,22 +347,22 @@ def test_config():
     print_header("TEST CATEGORY 9: CONFIGURATION")
 
     try:
-        import config
+        from config import GROK_SETTINGS, LLM_SETTINGS
 
         # Test Grok settings (PRIMARY LLM)
-        if config.GROK_SETTINGS.get('enabled'):
-            print_test("Grok-4 Configured", True, f"Model: {config.GROK_SETTINGS.get('model')}")
+        if GROK_SETTINGS.get('enabled'):
+            print_test("Grok-4 Configured", True, f"Model: {GROK_SETTINGS.get('model')}")
         else:
             print_test("Grok-4 Configured", False, "Grok not enabled")
 
         # Test Local LLM settings (EXPECTED TO BE DISABLED - system uses Grok-4 only)
-        if not config.LLM_SETTINGS.get('enabled'):
+        if not LLM_SETTINGS.get('enabled'):
             print_test("Local LLM Disabled (Expected)", True, "System uses Grok-4 exclusively")
         else:
             print_test("Local LLM Disabled (Expected)", False, "Local LLM should be disabled")
 
         # Test Grok API key present
-        has_grok_key = bool(config.GROK_SETTINGS.get('api_key'))
+        has_grok_key = bool(GROK_SETTINGS.get('api_key'))
         print_test("Grok API Key Configured", has_grok_key,
                   "Grok API key present" if has_grok_key else "No Grok API key")
 
@@ -347,22 +410,29 @@ def test_phase4_backend_integration():
     except Exception as e:
         print_test("Phase 4 Backend Integration", False, str(e))
 
+@pytest.mark.usefixtures("warm_faiss")
 def test_faiss_availability():
     """Test 11: FAISS Availability"""
     print_header("TEST CATEGORY 11: FAISS VECTOR SEARCH")
 
     try:
+        import os
         import faiss
         import numpy as np
 
         print_test("FAISS Library Available", True, f"Version: {faiss.__version__ if hasattr(faiss, '__version__') else 'Unknown'}")
 
-        # Test index creation
+        # Let the flat-index search use every core
+        faiss.omp_set_num_threads(os.cpu_count() or 1)
+
+        # Test index creation (same L2 index the RAG engine uses for normalized embeddings)
         dimension = 384
         index = faiss.IndexFlatL2(dimension)
 
-        # Add some vectors
-        vectors = np.random.random((10, dimension)).astype('float32')
+        # Add some vectors, generated directly as float32 and L2-normalized like real embeddings
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((10, dimension), dtype=np.float32)
+        faiss.normalize_L2(vectors)
         index.add(vectors)
 
         if index.ntotal == 10:
@@ -371,7 +441,8 @@ def test_faiss_availability():
             print_test("FAISS Index Creation", False, f"Expected 10, got {index.ntotal}")
 
         # Test search
-        query = np.random.random((1, dimension)).astype('float32')
+        query = rng.standard_normal((1, dimension), dtype=np.float32)
+        faiss.normalize_L2(query)
         distances, indices = index.search(query, 5)
 
         if len(indices[0]) == 5:
@@ -384,7 +455,9 @@ def test_faiss_availability():
 
 def run_all_tests():
     """Execute all tests"""
-    start_time = time.time()
+    global stats
+    stats = TestStats()
+    start_time = time.perf_counter()
 
     print_header("COMPREHENSIVE END-TO-END TESTING")
     print("Research Paper Discovery System - All Features")
@@ -404,48 +477,55 @@ def run_all_tests():
     test_phase4_backend_integration()
 
     # Summary
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
 
     print_header("TEST EXECUTION SUMMARY")
-    print(f"Total Tests: {total_tests}")
-    print(f"Passed: {passed_tests} ✅")
-    print(f"Failed: {failed_tests} ❌")
-    print(f"Success Rate: {(passed_tests/total_tests*100):.1f}%")
+    print(f"Total Tests: {stats.total}")
+    print(f"Passed: {stats.passed} {PASS_MARK}")
+    print(f"Failed: {stats.failed} {FAIL_MARK}")
+    print(f"Success Rate: {(stats.passed/stats.total*100):.1f}%")
     print(f"Total Time: {total_time:.2f}s")
 
     # Detailed results
-    if failed_tests > 0:
+    if stats.failed > 0:
         print(f"\n{'='*80}")
         print("FAILED TESTS DETAILS:")
         print(f"{'='*80}")
-        for result in test_results:
+        write = sys.stdout.write
+        for result in stats.results:
             if not result['status']:
-                print(f"\n❌ {result['test']}")
+                write(f"\n{FAIL_MARK} {result['test']}\n")
                 if result['message']:
-                    print(f"   Error: {result['message']}")
+                    write(f"   Error: {result['message']}\n")
 
     # Component status
     print(f"\n{'='*80}")
     print("COMPONENT STATUS:")
     print(f"{'='*80}")
-    print(f"✅ Database System: {'OK' if any('Database' in r['test'] and r['status'] for r in test_results) else 'FAILED'}")
-    print(f"✅ RAG Engine: {'OK' if any('RAG' in r['test'] and r['status'] for r in test_results) else 'FAILED'}")
-    print(f"✅ Multi-Agent System: {'OK' if any('Agent' in r['test'] and r['status'] for r in test_results) else 'FAILED'}")
-    print(f"✅ Document Chat: {'OK' if any('Chat' in r['test'] and r['status'] for r in test_results) else 'FAILED'}")
-    print(f"✅ Workflow Manager: {'OK' if any('Workflow' in r['test'] and r['status'] for r in test_results) else 'FAILED'}")
-    print(f"✅ PDF Processing: {'OK' if any('PDF' in r['test'] and r['status'] for r in test_results) else 'FAILED'}")
+    # Single pass over the results instead of one scan per component
+    component_ok = defaultdict(bool)
+    for r in stats.results:
+        if r['category'] is not None:
+            component_ok[r['category']] |= r['status']
+
+    print(f"{PASS_MARK} Database System: {'OK' if component_ok['Database'] else 'FAILED'}")
+    print(f"{PASS_MARK} RAG Engine: {'OK' if component_ok['RAG'] else 'FAILED'}")
+    print(f"{PASS_MARK} Multi-Agent System: {'OK' if component_ok['Agent'] else 'FAILED'}")
+    print(f"{PASS_MARK} Document Chat: {'OK' if component_ok['Chat'] else 'FAILED'}")
+    print(f"{PASS_MARK} Workflow Manager: {'OK' if component_ok['Workflow'] else 'FAILED'}")
+    print(f"{PASS_MARK} PDF Processing: {'OK' if component_ok['PDF'] else 'FAILED'}")
 
     # Final verdict
     print(f"\n{'='*80}")
-    if failed_tests == 0:
-        print("🎉 ALL TESTS PASSED! System is fully operational.")
-    elif failed_tests <= 3:
-        print("⚠️  MOSTLY PASSING - Minor issues detected.")
+    if stats.failed == 0:
+        print(f"{PARTY_MARK} ALL TESTS PASSED! System is fully operational.")
+    elif stats.failed <= 3:
+        print(f"{WARN_MARK} MOSTLY PASSING - Minor issues detected.")
     else:
-        print("❌ MULTIPLE FAILURES - System needs attention.")
+        print(f"{FAIL_MARK} MULTIPLE FAILURES - System needs attention.")
     print(f"{'='*80}\n")
 
-    return failed_tests == 0
+    return stats.failed == 0
 
 if __name__ == "__main__":
     success = run_all_tests()
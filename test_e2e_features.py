@@ -3,23 +3,45 @@ End-to-End Test: Complete Feature Testing with Quantum Computing Papers
 Tests both Analyze Paper and Chat with Paper features
 """
 
-import sys
-sys.path.append('.')
-
 from api_clients import SemanticScholarClient
 from paper_content_extractor import PaperContentExtractor
 from grok_client import GrokClient
-import config
+from config import GROK_SETTINGS, SEMANTIC_SCHOLAR_API_KEY
 import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+# Chat prompt, same wording as app.py; filled per question with the shared paper context
+CHAT_PROMPT_TEMPLATE = """You are a research assistant helping answer questions about an academic paper.
+
+Paper Information:
+{context}
 
+Question: {question}
 
+Instructions:
+- Answer the question based ONLY on the information provided above
+- Be specific and reference relevant details from the paper
+- If the information isn't available in the abstract/summary, clearly state that
+- Keep your answer concise but informative (2-3 paragraphs)
+- Use academic tone
+
+Answer:"""
+
+
+def has_real_abstract(abstract):
+    """True if the abstract is present and not the API's placeholder text"""
+    return bool(abstract) and abstract != 'No abstract available'
+
+
+@pytest.mark.integration
 def test_search():
     """Test 1: Search for quantum computing papers"""
     print("=" * 80)
     print("TEST 1: SEARCH FOR QUANTUM COMPUTING PAPERS")
     print("=" * 80)
 
-    client = SemanticScholarClient(api_key=config.SEMANTIC_SCHOLAR_API_KEY)
+    client = SemanticScholarClient(api_key=SEMANTIC_SCHOLAR_API_KEY)
 
     print("\n🔍 Searching for 'quantum computing'...")
     papers = client.search_papers("quantum computing", limit=5)
@@ -33,7 +55,7 @@ def test_search():
             print(f"   Authors: {', '.join([a['name'] for a in paper['authors'][:3]])}")
             print(f"   Year: {paper['year']} | Citations: {paper['citations']:,}")
             print(f"   TLDR: {'✅' if paper.get('tldr') else '❌'}")
-            print(f"   Abstract: {'✅' if paper.get('abstract') and paper['abstract'] != 'No abstract available' else '❌'}")
+            print(f"   Abstract: {'✅' if has_real_abstract(paper.get('abstract')) else '❌'}")
 
         return papers
     else:
@@ -41,6 +63,7 @@ def test_search():
         return []
 
 
+@pytest.mark.integration
 def test_content_extraction(paper):
     """Test 2: Extract content from metadata"""
     print("\n" + "=" * 80)
@@ -75,6 +98,7 @@ def test_content_extraction(paper):
     return result
 
 
+@pytest.mark.integration
 def test_chat_feature(paper):
     """Test 3: Chat with Paper feature"""
     print("\n" + "=" * 80)
@@ -92,82 +116,77 @@ def test_chat_feature(paper):
 
     print(f"\n🤖 Testing {len(test_questions)} questions...")
 
-    for i, question in enumerate(test_questions, 1):
-        print(f"\n{'─' * 80}")
-        print(f"Question {i}: {question}")
-        print(f"{'─' * 80}")
-
-        try:
-            start_time = time.time()
-
-            # Build context from metadata (same as in app.py)
-            title = paper.get('title', 'Unknown Title')
-            authors = ', '.join([a.get('name', 'Unknown') for a in paper.get('authors', [])[:5]])
-            year = paper.get('year', 'N/A')
-            venue = paper.get('venue', 'Unknown')
-            citations = paper.get('citations', 0)
-            tldr = paper.get('tldr', None)
-            abstract = paper.get('abstract', 'No abstract available')
-            fields = ', '.join(paper.get('fields_of_study', [])[:5]) or 'Not specified'
-
-            # Build rich context
-            context_parts = [
-                f"Title: {title}",
-                f"Authors: {authors}",
-                f"Year: {year}",
-                f"Venue: {venue}",
-                f"Citations: {citations:,}",
-                f"Fields of Study: {fields}"
-            ]
-
-            if tldr:
-                context_parts.append(f"\nTL;DR (AI-Generated Summary):\n{tldr}")
-
-            if abstract and abstract != 'No abstract available':
-                context_parts.append(f"\nAbstract:\n{abstract}")
-
-            context = '\n'.join(context_parts)
-
-            # Create prompt
-            prompt = f"""You are a research assistant helping answer questions about an academic paper.
+    # Build context from metadata (same as in app.py) - identical for every question
+    title = paper.get('title', 'Unknown Title')
+    authors = ', '.join([a.get('name', 'Unknown') for a in paper.get('authors', [])[:5]])
+    year = paper.get('year', 'N/A')
+    venue = paper.get('venue', 'Unknown')
+    citations = paper.get('citations', 0)
+    tldr = paper.get('tldr', None)
+    abstract = paper.get('abstract', 'No abstract available')
+    has_tldr = bool(tldr)
+    has_abstract = has_real_abstract(abstract)
+    fields = ', '.join(paper.get('fields_of_study', [])[:5]) or 'Not specified'
+
+    # Build rich context
+    context_parts = [
+        f"Title: {title}",
+        f"Authors: {authors}",
+        f"Year: {year}",
+        f"Venue: {venue}",
+        f"Citations: {citations:,}",
+        f"Fields of Study: {fields}"
+    ]
 
-Paper Information:
-{context}
+    if has_tldr:
+        context_parts.append(f"\nTL;DR (AI-Generated Summary):\n{tldr}")
 
-Question: {question}
+    if has_abstract:
+        context_parts.append(f"\nAbstract:\n{abstract}")
 
-Instructions:
-- Answer the question based ONLY on the information provided above
-- Be specific and reference relevant details from the paper
-- If the information isn't available in the abstract/summary, clearly state that
-- Keep your answer concise but informative (2-3 paragraphs)
-- Use academic tone
+    context = '\n'.join(context_parts)
 
-Answer:"""
+    # One client for all questions so its HTTP session (and connection) is reused
+    grok_client = GrokClient(
+        api_key=GROK_SETTINGS['api_key'],
+        model="grok-4-fast-reasoning",
+        validate=False
+    )
 
-            # Use Grok client
-            grok_client = GrokClient(
-                api_key=config.GROK_SETTINGS['api_key'],
-                model="grok-4-fast-reasoning",
-                validate=False
-            )
+    def ask(question):
+        """Send one question to Grok, returning (answer, elapsed) or the raised error"""
+        start_time = time.perf_counter()
+        try:
+            # Create prompt
+            prompt = CHAT_PROMPT_TEMPLATE.format(context=context, question=question)
 
             answer = grok_client.generate(
                 prompt=prompt,
                 max_tokens=500,
                 temperature=0.3
             )
+            return answer, time.perf_counter() - start_time
+        except Exception as e:
+            return e, time.perf_counter() - start_time
 
-            elapsed_time = time.time() - start_time
+    # Grok calls are network-bound, so send all questions at once
+    with ThreadPoolExecutor(max_workers=len(test_questions)) as executor:
+        responses = list(executor.map(ask, test_questions))
 
-            print(f"\n✅ Answer (in {elapsed_time:.2f}s):")
-            print(f"{answer[:500]}...")
-            print(f"\n📚 Sources used: {'TLDR + Abstract' if tldr else 'Abstract + Metadata'}")
+    for i, (question, (answer, elapsed_time)) in enumerate(zip(test_questions, responses), 1):
+        print(f"\n{'─' * 80}")
+        print(f"Question {i}: {question}")
+        print(f"{'─' * 80}")
 
-        except Exception as e:
-            print(f"\n❌ Error: {str(e)}")
+        if isinstance(answer, Exception):
+            print(f"\n❌ Error: {str(answer)}")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(type(answer), answer, answer.__traceback__)
+            continue
+
+        print(f"\n✅ Answer (in {elapsed_time:.2f}s):")
+        print(f"{answer[:500]}...")
+        print(f"\n📚 Sources used: {'TLDR + Abstract' if has_tldr else 'Abstract + Metadata'}")
 
     print(f"\n{'─' * 80}")
 
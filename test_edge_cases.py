@@ -1,201 +1,127 @@
 """
 Comprehensive Edge Case Testing Suite
 Tests all boundary conditions, error scenarios, and edge cases
+
+The tests are independent and can run across cores: pytest -n auto --dist=loadfile
+Shared fixtures (rag_components, db_path) live in conftest.py.
 """
 
+import functools
+import importlib
+import os
+import random
 import sys
-sys.path.append('.')
-
-from typing import Dict, List
-import time
-
-
-class EdgeCaseTestSuite:
-    """Comprehensive edge case testing"""
-
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.warnings = 0
-        self.test_results = []
-
-    def test(self, name: str, func, expected_behavior: str = "should not crash"):
-        """Run a single test"""
-        print(f"\n🧪 Testing: {name}")
-        print(f"   Expected: {expected_behavior}")
-
-        try:
-            result = func()
-            if result is False:
-                print(f"   ❌ FAIL: Test returned False")
-                self.failed += 1
-                self.test_results.append((name, "FAIL", "Returned False"))
-            else:
-                print(f"   ✅ PASS")
-                self.passed += 1
-                self.test_results.append((name, "PASS", ""))
-            return True
-        except Exception as e:
-            print(f"   ❌ FAIL: {str(e)[:100]}")
-            self.failed += 1
-            self.test_results.append((name, "FAIL", str(e)[:100]))
-            return False
-
-    def print_summary(self):
-        """Print test summary"""
-        print("\n" + "="*80)
-        print("📊 EDGE CASE TEST SUMMARY")
-        print("="*80)
-        print(f"Total Tests: {self.passed + self.failed}")
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(f"⚠️  Warnings: {self.warnings}")
-        print(f"Success Rate: {(self.passed/(self.passed+self.failed)*100):.1f}%")
-
-        if self.failed > 0:
-            print("\n❌ Failed Tests:")
-            for name, status, error in self.test_results:
-                if status == "FAIL":
-                    print(f"   - {name}: {error}")
-
-
-# Initialize test suite
-suite = EdgeCaseTestSuite()
-
-print("="*80)
-print("🔬 COMPREHENSIVE EDGE CASE TESTING")
-print("="*80)
+import types
 
-# ==============================================================================
-# CATEGORY 1: CONFIG & ENVIRONMENT TESTS
-# ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 1: Configuration & Environment")
-print("="*80)
+import pytest
 
-def test_env_file_exists():
-    import os
-    return os.path.exists('.env')
+import config
+from config import GROK_SETTINGS, SEMANTIC_SCHOLAR_API_KEY
+from quality_scoring import PaperQualityScorer
+from rag_system.database import RAGDatabase
 
-suite.test(
-    "ENV file exists",
-    test_env_file_exists,
-    "should have .env file"
-)
 
-def test_env_variables_loaded():
-    import config
-    # Check if environment variables are loaded (they should be strings, not empty if loaded)
-    return isinstance(config.SEMANTIC_SCHOLAR_API_KEY, str)
+def _unavailable(error):
+    """Stand-in for a component whose import failed; re-raises the ImportError when used"""
+    def raiser(*args, **kwargs):
+        raise error
+    return raiser
 
-suite.test(
-    "Environment variables loaded",
-    test_env_variables_loaded,
-    "should load from .env"
-)
 
-def test_grok_api_key_present():
-    import config
-    return len(config.GROK_SETTINGS['api_key']) > 0
+# Heavy/optional dependencies (torch, aiohttp, requests, ...) are imported once here;
+# a missing one fails only the tests that use it instead of aborting the whole suite
+try:
+    from rag_system.enhanced_rag import create_enhanced_rag_system
+except ImportError as e:
+    create_enhanced_rag_system = _unavailable(e)
 
-suite.test(
-    "Grok API key present",
-    test_grok_api_key_present,
-    "should have API key configured"
-)
+try:
+    from multi_agent_system import create_orchestrator
+except ImportError as e:
+    create_orchestrator = _unavailable(e)
 
-def test_config_imports():
-    import config
-    # Check all major config sections exist
-    return (hasattr(config, 'GROK_SETTINGS') and
-            hasattr(config, 'MULTI_AGENT_CONFIG') and
-            hasattr(config, 'RATE_LIMITS'))
+try:
+    from grok_client import GrokClient
+except ImportError as e:
+    GrokClient = _unavailable(e)
 
-suite.test(
-    "Config structure complete",
-    test_config_imports,
-    "should have all config sections"
-)
+try:
+    from api_clients import SemanticScholarClient, ArXivClient
+except ImportError as e:
+    SemanticScholarClient = ArXivClient = _unavailable(e)
 
-# ==============================================================================
-# CATEGORY 2: IMPORT TESTS
-# ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 2: Critical Import Tests")
-print("="*80)
+class DummyLLM:
+    """Offline stand-in for GrokClient's generate/chat surface; records prompts for assertions"""
 
-def test_import_multi_agent():
-    from multi_agent_system import create_orchestrator
-    return True
+    def __init__(self, response=""):
+        self.response = response
+        self.calls = []
 
-suite.test(
-    "Import multi-agent system",
-    test_import_multi_agent,
-    "should import without errors"
-)
+    def generate(self, prompt, max_tokens=1000, temperature=0.7):
+        self.calls.append(prompt)
+        return self.response
 
-def test_import_rag_system():
-    from rag_system.enhanced_rag import create_enhanced_rag_system
-    return True
+    def chat(self, messages, max_tokens=1000, temperature=0.7):
+        self.calls.append(messages)
+        return self.response
 
-suite.test(
-    "Import RAG system",
-    test_import_rag_system,
-    "should import without errors"
-)
 
-def test_import_grok_client():
-    from grok_client import GrokClient
-    return True
+# Bind the settings used by many tests once instead of re-resolving config.X[...] each time
+GROK_API_KEY = GROK_SETTINGS['api_key']
+GROK_MODEL = GROK_SETTINGS['model']
 
-suite.test(
-    "Import Grok client",
-    test_import_grok_client,
-    "should import without errors"
-)
 
-def test_import_shared_analysis():
-    from shared_analysis import analyze_paper_comprehensive_shared
-    return True
+# ==============================================================================
+# CATEGORY 1: CONFIG & ENVIRONMENT TESTS
+# ==============================================================================
+
+def test_env_file_exists():
+    """ENV file exists - should have .env file"""
+    assert os.path.exists('.env')
+
+def test_env_variables_loaded():
+    """Environment variables loaded - should load from .env"""
+    # Check if environment variables are loaded (they should be strings, not empty if loaded)
+    assert isinstance(SEMANTIC_SCHOLAR_API_KEY, str)
+
+def test_grok_api_key_present():
+    """Grok API key present - should have API key configured"""
+    assert len(GROK_API_KEY) > 0
 
-suite.test(
-    "Import shared analysis",
-    test_import_shared_analysis,
-    "should import without errors"
-)
+def test_config_imports():
+    """Config structure complete - should have all config sections"""
+    # Check all major config sections exist
+    assert hasattr(config, 'GROK_SETTINGS')
+    assert hasattr(config, 'MULTI_AGENT_CONFIG')
+    assert hasattr(config, 'RATE_LIMITS')
 
-def test_import_quality_scoring():
-    from quality_scoring import PaperQualityScorer
-    return True
+# ==============================================================================
+# CATEGORY 2: IMPORT TESTS
+# ==============================================================================
 
-suite.test(
-    "Import quality scoring",
-    test_import_quality_scoring,
-    "should import without errors"
-)
+@pytest.mark.parametrize("module_path, attr", [
+    ("multi_agent_system", "create_orchestrator"),
+    ("rag_system.enhanced_rag", "create_enhanced_rag_system"),
+    ("grok_client", "GrokClient"),
+    ("shared_analysis", "analyze_paper_comprehensive_shared"),
+    ("quality_scoring", "PaperQualityScorer"),
+])
+def test_critical_imports(module_path, attr):
+    """Critical modules should import without errors"""
+    module = importlib.import_module(module_path)
+    assert hasattr(module, attr)
 
 # ==============================================================================
 # CATEGORY 3: RAG SYSTEM EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 3: RAG System Edge Cases")
-print("="*80)
 
 def test_rag_init_no_params():
-    """Test RAG initialization with no parameters"""
-    from rag_system.enhanced_rag import create_enhanced_rag_system
+    """RAG init without parameters - should initialize with defaults"""
     components = create_enhanced_rag_system()
-    return components is not None and 'rag' in components
-
-suite.test(
-    "RAG init without parameters",
-    test_rag_init_no_params,
-    "should initialize with defaults"
-)
+    assert components is not None and 'rag' in components
 
 def test_rag_init_with_paper():
-    """Test RAG initialization with paper data"""
-    from rag_system.enhanced_rag import create_enhanced_rag_system
+    """RAG init with paper data - should index paper correctly"""
     paper_data = {
         'title': 'Test Paper',
         'sections': {
@@ -204,222 +130,137 @@ def test_rag_init_with_paper():
         }
     }
     components = create_enhanced_rag_system(paper_data=paper_data)
-    return components is not None and components['rag'].paper_data is not None
-
-suite.test(
-    "RAG init with paper data",
-    test_rag_init_with_paper,
-    "should index paper correctly"
-)
-
-def test_rag_empty_query():
-    """Test RAG with empty query"""
-    from rag_system.enhanced_rag import create_enhanced_rag_system
-    paper_data = {
-        'title': 'Test Paper on Quantum Computing',
-        'sections': {'introduction': 'This is test content about quantum computing, machine learning, and their applications in scientific research domains.'}
-    }
-    components = create_enhanced_rag_system(paper_data=paper_data)
-    results = components['rag'].retrieve("", top_k=5)
-    return True  # Should not crash
+    assert components is not None and components['rag'].paper_data is not None
 
-suite.test(
-    "RAG retrieve with empty query",
-    test_rag_empty_query,
-    "should handle gracefully"
-)
+def test_rag_empty_query(rag_components):
+    """RAG retrieve with empty query - should handle gracefully"""
+    rag_components['rag'].retrieve("", top_k=5)  # Should not crash
 
-def test_rag_very_long_query():
-    """Test RAG with very long query"""
-    from rag_system.enhanced_rag import create_enhanced_rag_system
-    paper_data = {
-        'title': 'Test Paper on Quantum Computing',
-        'sections': {'introduction': 'This is test content about quantum computing, machine learning, and their applications in scientific research domains.'}
-    }
-    components = create_enhanced_rag_system(paper_data=paper_data)
+def test_rag_very_long_query(rag_components):
+    """RAG retrieve with very long query - should handle gracefully"""
     long_query = "quantum computing " * 100  # 200 words
-    results = components['rag'].retrieve(long_query, top_k=5)
-    return True  # Should not crash
+    rag_components['rag'].retrieve(long_query, top_k=5)  # Should not crash
 
-suite.test(
-    "RAG retrieve with very long query",
-    test_rag_very_long_query,
-    "should handle gracefully"
-)
-
-def test_rag_special_characters():
-    """Test RAG with special characters in query"""
-    from rag_system.enhanced_rag import create_enhanced_rag_system
-    paper_data = {
-        'title': 'Test Paper on Quantum Computing',
-        'sections': {'introduction': 'This is test content about quantum computing, machine learning, and their applications in scientific research domains.'}
-    }
-    components = create_enhanced_rag_system(paper_data=paper_data)
+def test_rag_special_characters(rag_components):
+    """RAG retrieve with special characters - should handle gracefully"""
     special_query = "What's @#$%^&*() the method?"
-    results = components['rag'].retrieve(special_query, top_k=5)
-    return True  # Should not crash
+    rag_components['rag'].retrieve(special_query, top_k=5)  # Should not crash
 
-suite.test(
-    "RAG retrieve with special characters",
-    test_rag_special_characters,
-    "should handle gracefully"
-)
-
-def test_rag_result_structure():
-    """Test that RAG results have both 'content' and 'text' fields"""
-    from rag_system.enhanced_rag import create_enhanced_rag_system
-    paper_data = {
-        'title': 'Test Paper on Quantum Computing',
-        'sections': {'introduction': 'This is test content about quantum computing, machine learning, and their applications in scientific research domains.'}
-    }
-    components = create_enhanced_rag_system(paper_data=paper_data)
-    results = components['rag'].retrieve("quantum", top_k=1)
+def test_rag_result_structure(rag_components):
+    """RAG results have both 'content' and 'text' fields - backward compatibility"""
+    results = rag_components['rag'].retrieve("quantum", top_k=1)
 
+    # Empty results are okay
     if len(results) > 0:
-        return 'content' in results[0] and 'text' in results[0]
-    return True  # Empty results are okay
-
-suite.test(
-    "RAG result has both content and text fields",
-    test_rag_result_structure,
-    "should have backward compatibility"
-)
+        assert 'content' in results[0] and 'text' in results[0]
 
 # ==============================================================================
 # CATEGORY 4: MULTI-AGENT SYSTEM EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 4: Multi-Agent System Edge Cases")
-print("="*80)
 
-def test_orchestrator_creation():
-    """Test orchestrator creation"""
-    from multi_agent_system import create_orchestrator
-    orchestrator = create_orchestrator({})
-    return orchestrator is not None
+@pytest.fixture(scope="session")
+def empty_orchestrator():
+    """Orchestrator built once from an empty config (the tests below do not mutate it)"""
+    return create_orchestrator({})
 
-suite.test(
-    "Create orchestrator with empty config",
-    test_orchestrator_creation,
-    "should create with defaults"
-)
+def test_orchestrator_creation(empty_orchestrator):
+    """Create orchestrator with empty config - should create with defaults"""
+    assert empty_orchestrator is not None
 
-def test_orchestrator_with_invalid_sources():
-    """Test orchestrator with invalid sources"""
-    from multi_agent_system import create_orchestrator
-    orchestrator = create_orchestrator({})
+def test_orchestrator_with_invalid_sources(empty_orchestrator):
+    """Orchestrator with invalid sources - should handle gracefully"""
+    assert empty_orchestrator is not None
     # Try to search with invalid sources - should handle gracefully
-    return True
-
-suite.test(
-    "Orchestrator with invalid sources",
-    test_orchestrator_with_invalid_sources,
-    "should handle gracefully"
-)
 
 # ==============================================================================
 # CATEGORY 5: GROK CLIENT EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 5: Grok Client Edge Cases")
-print("="*80)
+
+class StubSession:
+    """Offline stand-in for GrokClient.session; records posted payloads"""
+
+    def __init__(self, content="ok", error=None):
+        self.content = content
+        self.error = error
+        self.payloads = []
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        self.payloads.append(json)
+        if self.error is not None:
+            raise self.error
+        return types.SimpleNamespace(
+            raise_for_status=lambda: None,
+            json=lambda: {'choices': [{'message': {'content': self.content}}]}
+        )
+
+
+def _offline_grok(session):
+    client = GrokClient(api_key=GROK_API_KEY, model=GROK_MODEL, validate=False)
+    client.session = session
+    return client
+
 
 def test_grok_empty_prompt():
-    """Test Grok with empty prompt"""
-    from grok_client import GrokClient
-    import config
+    """Grok client with an empty prompt - should send it as-is and return the reply"""
+    session = StubSession(content="empty ok")
+    client = _offline_grok(session)
 
-    try:
-        client = GrokClient(
-            api_key=config.GROK_SETTINGS['api_key'],
-            model=config.GROK_SETTINGS['model'],
-            validate=False
-        )
-        # Empty prompt should be handled
-        return True
-    except:
-        return True  # Any error handling is acceptable
+    assert client.generate("") == "empty ok"
+    assert session.payloads[0]['messages'] == [{"role": "user", "content": ""}]
+    assert session.payloads[0]['model'] == GROK_MODEL
 
-suite.test(
-    "Grok client with empty config",
-    test_grok_empty_prompt,
-    "should initialize or fail gracefully"
-)
 
 def test_grok_very_long_prompt():
-    """Test Grok with very long prompt"""
-    from grok_client import GrokClient
-    import config
+    """Grok client with a very long prompt - should send it untruncated; errors become strings"""
+    prompt = "word " * 50000
+    session = StubSession(content="long ok")
+    client = _offline_grok(session)
 
-    try:
-        client = GrokClient(
-            api_key=config.GROK_SETTINGS['api_key'],
-            model=config.GROK_SETTINGS['model'],
-            validate=False
-        )
-        # Very long prompt - client should handle
-        return True
-    except:
-        return True
+    assert client.generate(prompt, max_tokens=10) == "long ok"
+    assert session.payloads[0]['messages'][0]['content'] == prompt
+    assert session.payloads[0]['max_tokens'] == 10
 
-suite.test(
-    "Grok client initialization",
-    test_grok_very_long_prompt,
-    "should handle or fail gracefully"
-)
+    import requests
+    client.session = StubSession(error=requests.exceptions.Timeout())
+    assert client.generate(prompt) == "Error: Grok API request timed out"
 
 # ==============================================================================
 # CATEGORY 6: DATABASE EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 6: Database Edge Cases")
-print("="*80)
-
-def test_database_init():
-    """Test database initialization"""
-    from rag_system.database import RAGDatabase
-    import tempfile
-    import os
-    # Use temporary database for testing
-    temp_dir = tempfile.mkdtemp()
-    db_path = os.path.join(temp_dir, "test.db")
+
+def test_database_init(db_path):
+    """Database initialization - should create tables"""
     db = RAGDatabase(db_path=db_path)
-    return db is not None
-
-suite.test(
-    "Database initialization",
-    test_database_init,
-    "should create tables"
-)
-
-def test_database_multiple_init():
-    """Test database multiple initializations"""
-    from rag_system.database import RAGDatabase
-    import tempfile
-    import os
-    # Use temporary database for testing
-    temp_dir = tempfile.mkdtemp()
-    db_path = os.path.join(temp_dir, "test.db")
+    try:
+        assert db is not None
+    finally:
+        db.close()
+
+def test_database_multiple_init(db_path):
+    """Database multiple initializations - should be idempotent"""
     db1 = RAGDatabase(db_path=db_path)
     db2 = RAGDatabase(db_path=db_path)  # Should not crash on second init
-    return db1 is not None and db2 is not None
+    try:
+        assert db1 is not None and db2 is not None
+    finally:
+        db1.close()
+        db2.close()
 
-suite.test(
-    "Database multiple initializations",
-    test_database_multiple_init,
-    "should be idempotent"
-)
+def test_database_list_tables(db_path):
+    """Database schema - core tables are reported by list_tables()"""
+    db = RAGDatabase(db_path=db_path)
+    try:
+        tables = db.list_tables()
+        assert {'documents', 'document_chunks', 'document_analyses', 'chat_history'} <= tables
+    finally:
+        db.close()
 
 # ==============================================================================
 # CATEGORY 7: QUALITY SCORING EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 7: Quality Scoring Edge Cases")
-print("="*80)
 
 def test_quality_score_missing_fields():
-    """Test quality scoring with missing fields"""
-    from quality_scoring import PaperQualityScorer
+    """Quality scoring with missing fields - should handle gracefully with defaults"""
     scorer = PaperQualityScorer()
 
     paper = {
@@ -428,17 +269,10 @@ def test_quality_score_missing_fields():
     }
 
     score = scorer.calculate_score(paper)
-    return 0 <= score <= 100  # Should return valid score
-
-suite.test(
-    "Quality scoring with missing fields",
-    test_quality_score_missing_fields,
-    "should handle gracefully with defaults"
-)
+    assert 0 <= score <= 100  # Should return valid score
 
 def test_quality_score_negative_citations():
-    """Test quality scoring with negative citations"""
-    from quality_scoring import PaperQualityScorer
+    """Quality scoring with negative citations - should handle invalid values"""
     scorer = PaperQualityScorer()
 
     paper = {
@@ -448,17 +282,10 @@ def test_quality_score_negative_citations():
     }
 
     score = scorer.calculate_score(paper)
-    return 0 <= score <= 100
-
-suite.test(
-    "Quality scoring with negative citations",
-    test_quality_score_negative_citations,
-    "should handle invalid values"
-)
+    assert 0 <= score <= 100
 
 def test_quality_score_future_year():
-    """Test quality scoring with future year"""
-    from quality_scoring import PaperQualityScorer
+    """Quality scoring with future year - should handle invalid dates"""
     scorer = PaperQualityScorer()
 
     paper = {
@@ -468,17 +295,10 @@ def test_quality_score_future_year():
     }
 
     score = scorer.calculate_score(paper)
-    return 0 <= score <= 100
-
-suite.test(
-    "Quality scoring with future year",
-    test_quality_score_future_year,
-    "should handle invalid dates"
-)
+    assert 0 <= score <= 100
 
 def test_quality_score_very_old_paper():
-    """Test quality scoring with very old paper"""
-    from quality_scoring import PaperQualityScorer
+    """Quality scoring with very old paper - should handle old dates"""
     scorer = PaperQualityScorer()
 
     paper = {
@@ -488,61 +308,99 @@ def test_quality_score_very_old_paper():
     }
 
     score = scorer.calculate_score(paper)
-    return 0 <= score <= 100
+    assert 0 <= score <= 100
 
-suite.test(
-    "Quality scoring with very old paper",
-    test_quality_score_very_old_paper,
-    "should handle old dates"
-)
+def test_quality_score_batch_matches_single():
+    """Batch scoring - invalid values handled identically to single-paper scoring"""
+    scorer = PaperQualityScorer()
+
+    papers = [
+        {'title': 'Missing fields'},
+        {'title': 'Negative', 'citations': -10, 'year': 2024},
+        {'title': 'Zero', 'citations': 0, 'year': 2024},
+        {'title': 'Future', 'citations': 10, 'year': 2030},
+        {'title': 'Very old', 'citations': 1000, 'year': 1900},
+        {'title': 'None year', 'citations': 50, 'year': None},
+    ]
+
+    scores = scorer.calculate_scores_batch(papers)
+    assert len(scores) == len(papers)
+    assert list(scores) == [scorer.calculate_score(p) for p in papers]
+    assert scores[1] == scores[2]  # Negative citations treated as 0
+    assert scorer.calculate_scores_batch([]).size == 0
+
+def _scalar_quality_score(scorer, paper):
+    """Reference score built from the per-paper component methods"""
+    weights = config.QUALITY_WEIGHTS
+    return round(
+        weights['citations'] * scorer._calculate_citation_score(paper) +
+        weights['author_reputation'] * scorer._calculate_author_score(paper) +
+        weights['venue_quality'] * scorer._calculate_venue_score(paper) +
+        weights['recency'] * scorer._calculate_recency_score(paper) +
+        weights['additional_signals'] * scorer._calculate_additional_signals(paper),
+        3
+    )
+
+def test_quality_score_batch_parity_random():
+    """Batch scoring - matches the per-paper component methods on random and edge inputs"""
+    scorer = PaperQualityScorer(current_year=2025)
+    rng = random.Random(0)
+    missing = object()
+
+    year_choices = [missing, None, 0, -1, -2000, 1, 1900, 2015, 2024, 2025, 2026, 3000]
+    count_choices = [missing, None, 0, -5, 1, 7, 150, 10_000]
+
+    papers = []
+    for _ in range(500):
+        paper = {'title': 'Random paper'}
+        for field, choices in (
+            ('year', year_choices + [rng.randint(-50, 2030)]),
+            ('citations', count_choices + [rng.randint(-10, 5000)]),
+            ('influential_citations', count_choices + [rng.randint(-10, 500)]),
+        ):
+            value = rng.choice(choices)
+            if value is not missing:
+                paper[field] = value
+        papers.append(paper)
+
+    scores = scorer.calculate_scores_batch(papers)
+    expected = [_scalar_quality_score(scorer, p) for p in papers]
+    assert list(scores) == pytest.approx(expected, abs=1e-9)
 
 # ==============================================================================
 # CATEGORY 8: API CLIENT EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 8: API Client Edge Cases")
-print("="*80)
 
 def test_semantic_scholar_empty_query():
-    """Test Semantic Scholar with empty query"""
-    from api_clients import SemanticScholarClient
-    import config
-
-    client = SemanticScholarClient(config.SEMANTIC_SCHOLAR_API_KEY)
+    """Semantic Scholar client init - should initialize"""
+    client = SemanticScholarClient(SEMANTIC_SCHOLAR_API_KEY)
     # Empty query should be handled
-    return True
-
-suite.test(
-    "Semantic Scholar client init",
-    test_semantic_scholar_empty_query,
-    "should initialize"
-)
 
 def test_arxiv_special_chars():
-    """Test arXiv with special characters"""
-    from api_clients import ArXivClient
-
+    """arXiv client initialization - should initialize"""
     client = ArXivClient()
     # Special characters should be handled
-    return True
-
-suite.test(
-    "arXiv client initialization",
-    test_arxiv_special_chars,
-    "should initialize"
-)
 
 # ==============================================================================
 # CATEGORY 9: FILE SYSTEM EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 9: File System Edge Cases")
-print("="*80)
 
-def test_required_files_exist():
-    """Test that all required files exist"""
-    import os
+@functools.lru_cache(maxsize=None)
+def _dir_entries(path='.'):
+    """Names in a directory mapped to whether each is a directory (one scandir per dir)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+def _path_exists(path):
+    """os.path.exists() answered from cached directory listings"""
+    parent, name = os.path.split(path)
+    return name in _dir_entries(parent or '.')
 
+def test_required_files_exist():
+    """All required files exist - should have all files"""
     required_files = [
         'app.py',
         'config.py',
@@ -552,99 +410,45 @@ def test_required_files_exist():
         'rag_system/enhanced_rag.py'
     ]
 
-    for file in required_files:
-        if not os.path.exists(file):
-            print(f"      Missing: {file}")
-            return False
-
-    return True
-
-suite.test(
-    "All required files exist",
-    test_required_files_exist,
-    "should have all files"
-)
+    missing = [file for file in required_files if not _path_exists(file)]
+    assert not missing, f"Missing: {missing}"
 
 def test_pages_directory_exists():
-    """Test that pages directory exists"""
-    import os
-    return os.path.exists('pages') and os.path.isdir('pages')
-
-suite.test(
-    "Pages directory exists",
-    test_pages_directory_exists,
-    "should have pages folder"
-)
+    """Pages directory exists - should have pages folder"""
+    assert _dir_entries('.').get('pages', False)
 
 # ==============================================================================
 # CATEGORY 10: INTEGRATION EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 10: Integration Edge Cases")
-print("="*80)
 
 def test_rag_with_grok():
-    """Test RAG system with Grok integration"""
-    from rag_system.enhanced_rag import create_enhanced_rag_system
-    from grok_client import GrokClient
-    import config
-
-    try:
-        llm = GrokClient(
-            api_key=config.GROK_SETTINGS['api_key'],
-            model=config.GROK_SETTINGS['model'],
-            validate=False
-        )
-
-        paper_data = {
-            'title': 'Test',
-            'sections': {'intro': 'quantum computing fundamentals'}
-        }
+    """RAG integration with an LLM client - should create all components"""
+    llm = DummyLLM()
 
-        components = create_enhanced_rag_system(paper_data=paper_data, llm_client=llm)
+    paper_data = {
+        'title': 'Test',
+        'sections': {'intro': 'quantum computing fundamentals'}
+    }
 
-        # Check all components initialized
-        return (components['query_expander'] is not None and
-                components['multi_hop_qa'] is not None and
-                components['self_reflective'] is not None)
-    except:
-        # If Grok unavailable, that's okay
-        return True
+    components = create_enhanced_rag_system(paper_data=paper_data, llm_client=llm)
 
-suite.test(
-    "RAG integration with Grok",
-    test_rag_with_grok,
-    "should create all components"
-)
+    # Check all components initialized
+    assert components['query_expander'] is not None
+    assert components['multi_hop_qa'] is not None
+    assert components['self_reflective'] is not None
+    assert llm.calls == []  # Building the pipeline must not call the LLM
 
 def test_shared_analysis_import_from_multiagent():
-    """Test that Multi-Agent page can import shared analysis"""
-    try:
-        # Simulate import from pages directory
-        import importlib.util
-        import os
-
-        # Check if shared_analysis can be imported
-        from shared_analysis import analyze_paper_comprehensive_shared
-        return True
-    except:
-        return False
-
-suite.test(
-    "Shared analysis accessible from pages",
-    test_shared_analysis_import_from_multiagent,
-    "should be importable"
-)
+    """Shared analysis accessible from pages - should be importable"""
+    # Check if shared_analysis can be imported (as the Multi-Agent page does)
+    from shared_analysis import analyze_paper_comprehensive_shared
 
 # ==============================================================================
 # CATEGORY 11: PAGINATION EDGE CASES
 # ==============================================================================
-print("\n" + "="*80)
-print("CATEGORY 11: Pagination Edge Cases")
-print("="*80)
 
 def test_pagination_logic():
-    """Test pagination calculation"""
+    """Pagination calculation edge cases - should calculate correctly"""
     # Simulate pagination logic from app.py
 
     # Test case 1: Normal case
@@ -668,16 +472,8 @@ def test_pagination_logic():
     total_pages = max(1, (len(results) - 1) // page_size + 1)
     assert total_pages == 1, f"Expected 1 page for single item, got {total_pages}"
 
-    return True
-
-suite.test(
-    "Pagination calculation edge cases",
-    test_pagination_logic,
-    "should calculate correctly"
-)
-
 def test_page_reset_logic():
-    """Test page reset when exceeds total"""
+    """Page reset when exceeds total - should reset to last valid page"""
     # Simulate the fix we applied
     current_page = 5
     total_pages = 2
@@ -686,25 +482,7 @@ def test_page_reset_logic():
         current_page = total_pages - 1
 
     assert current_page == 1, f"Expected page 1, got {current_page}"
-    return True
-
-suite.test(
-    "Page reset when exceeds total",
-    test_page_reset_logic,
-    "should reset to last valid page"
-)
-
-# ==============================================================================
-# Print final summary
-# ==============================================================================
 
-suite.print_summary()
 
-if suite.failed == 0:
-    print("\n🎉 ALL EDGE CASES PASSED!")
-    print("✅ System is robust and handles all edge cases correctly")
-    exit(0)
-else:
-    print(f"\n⚠️  {suite.failed} edge cases failed")
-    print("❌ Some edge cases need attention")
-    exit(1)
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -12,7 +12,12 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import required modules
 from rag_system.analysis_agents import DocumentAnalysisOrchestrator
+from rag_system.pdf_processor_cache import DEFAULT_CACHE_DIR
 from report_utils.report_generator import format_analysis_to_document, generate_pdf_report
+import pytest
+
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
 def test_end_to_end_workflow():
     """Test complete document analysis workflow"""
@@ -46,7 +51,8 @@ def test_end_to_end_workflow():
     print()
 
     try:
-        orchestrator = DocumentAnalysisOrchestrator()
+        # PDF parsing is deterministic - the orchestrator reuses the on-disk extraction across runs
+        orchestrator = DocumentAnalysisOrchestrator(extraction_cache_dir=DEFAULT_CACHE_DIR)
 
         start_time = time.time()
         analysis_result = orchestrator.analyze_paper(
@@ -146,14 +152,15 @@ def test_end_to_end_workflow():
     # Step 5: Verify PDF structure
     print("Step 5: Verifying PDF structure...")
     try:
-        import subprocess
-        result = subprocess.run(['file', str(output_path)], capture_output=True, text=True)
+        # Check the %PDF- magic bytes in-process instead of shelling out to file(1)
+        with open(output_path, 'rb') as f:
+            header = f.read(8)
 
-        if 'PDF document' in result.stdout:
+        if header.startswith(b'%PDF-'):
             print(f"✅ Valid PDF document")
-            print(f"   {result.stdout.strip()}")
+            print(f"   Header: {header.decode('latin-1').strip()}")
         else:
-            print(f"❌ Invalid PDF: {result.stdout}")
+            print(f"❌ Invalid PDF header: {header!r}")
             return False
 
     except Exception as e:
@@ -3,12 +3,41 @@ Test to verify exception handling improvements
 Tests Fix #7: Bare exception handlers replaced with specific exceptions
 """
 
+import ast
+import functools
+import io
+import os
+import re
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from testing_support import get_test_logger
+
+# Full tracebacks only with LOG_LEVEL=DEBUG; normal runs print just the error
+logger = get_test_logger(__name__)
+
+# Case-insensitive "exception" search without building a lowercased copy of the file
+_EXCEPTION_WORD = re.compile('exception', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text(file_path):
+    """File contents, read once per process (Tests 2 and 3 check overlapping files)"""
+    return Path(file_path).read_text(encoding='utf-8', errors='ignore')
+
+
+def _find_bare_excepts(path):
+    """Line numbers of bare `except:` handlers (comments and strings cannot match)"""
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    return sorted(
+        node.lineno for node in ast.walk(tree)
+        if isinstance(node, ast.ExceptHandler) and node.type is None
+    )
+
 
 def test_no_bare_exceptions_in_production():
     """Verify no bare exception handlers in production code"""
@@ -27,21 +56,22 @@ def test_no_bare_exceptions_in_production():
         ]
 
         issues_found = []
+        # FAST_FAIL=1 (CI) stops at the first offending file; by default every
+        # issue is listed
+        fast_fail = os.environ.get('FAST_FAIL') == '1'
 
         for file_path in production_files:
-            path = Path(file_path)
-            if not path.exists():
+            # Check for bare exception handlers (one open; missing files are skipped)
+            try:
+                line_nums = _find_bare_excepts(Path(file_path))
+            except FileNotFoundError:
                 print(f"  ⚠️  Skipping {file_path} (not found)")
                 continue
 
-            with open(path, 'r') as f:
-                lines = f.readlines()
-
-            # Check for bare exception handlers
-            for i, line in enumerate(lines, 1):
-                stripped = line.strip()
-                if stripped == "except:":
-                    issues_found.append((file_path, i))
+            for line_num in line_nums:
+                issues_found.append((file_path, line_num))
+            if fast_fail and issues_found:
+                break
 
         if len(issues_found) > 0:
             print(f"  ❌ Found {len(issues_found)} bare exception handlers:")
@@ -83,18 +113,12 @@ def test_specific_exceptions_used():
         }
 
         for file_path, patterns in expected_patterns.items():
-            path = Path(file_path)
-            if not path.exists():
+            try:
+                content = _read_text(file_path)
+            except FileNotFoundError:
                 print(f"  ⚠️  Skipping {file_path} (not found)")
                 continue
-
-            with open(path, 'r') as f:
-                content = f.read()
-
-            found_count = 0
-            for pattern in patterns:
-                if pattern in content:
-                    found_count += 1
+            found_count = sum(pattern in content for pattern in patterns)
 
             if found_count > 0:
                 print(f"  ✓ {file_path}: Found {found_count} specific exception handlers")
@@ -124,22 +148,19 @@ def test_exception_logging_present():
         }
 
         for file_path, expected_message in files_to_check.items():
-            path = Path(file_path)
-            if not path.exists():
+            try:
+                content = _read_text(file_path)
+            except FileNotFoundError:
                 print(f"  ⚠️  Skipping {file_path} (not found)")
                 continue
 
-            with open(path, 'r') as f:
-                content = f.read()
-
             if expected_message in content or "print(f\"" in content:
                 print(f"  ✓ {file_path}: Has exception logging")
+            # Check for at least comments
+            elif "# " in content and _EXCEPTION_WORD.search(content):
+                print(f"  ✓ {file_path}: Has exception comments")
             else:
-                # Check for at least comments
-                if "# " in content and "exception" in content.lower():
-                    print(f"  ✓ {file_path}: Has exception comments")
-                else:
-                    raise Exception(f"No logging or comments found in {file_path}")
+                raise Exception(f"No logging or comments found in {file_path}")
 
         print("✅ Test 3 PASSED\n")
         return True
@@ -180,9 +201,8 @@ def test_code_still_runs():
         return True
 
     except Exception as e:
-        print(f"❌ Test 4 FAILED: {e}\n")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Test 4 FAILED: {e!r}\n")
+        logger.debug("Test 4 failure", exc_info=True)
         return False
 
 
@@ -201,9 +221,15 @@ def main():
         test_code_still_runs
     ]
 
+    # Buffer each test's report and write it in one call instead of a write
+    # per print()
     results = []
     for test_func in tests:
-        result = test_func()
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            result = test_func()
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
         results.append(result)
 
     # Summary
@@ -4,12 +4,19 @@ Test IntroductionAgent with Transformer Paper
 """
 
 import sys
-import json
-from rag_system.pdf_processor import PDFProcessor
+import orjson
+from testing_support import ORJSON_OPTIONS
+from textwrap import fill
+from pathlib import Path
+from rag_system.pdf_processor_cache import extract_cached
 from rag_system.analysis_agents.introduction_agent import IntroductionAgent
+import pytest
 
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
-def test_introduction_agent():
+
+def test_introduction_agent(intro_agent):
     print("=" * 80)
     print("INTRODUCTIONAGENT TEST - Transformer Paper")
     print("=" * 80)
@@ -26,8 +33,7 @@ def test_introduction_agent():
     try:
         # Extract PDF
         print("\nExtracting Introduction section...")
-        processor = PDFProcessor()
-        extraction_result = processor.extract_text_by_sections(pdf_path)
+        extraction_result = extract_cached(pdf_path, Path(pdf_path).stat().st_mtime_ns)
 
         if not extraction_result['success']:
             print(f"❌ Extraction failed: {extraction_result['message']}")
@@ -64,8 +70,7 @@ def test_introduction_agent():
 
         # Test agent
         print("\n⏳ Running IntroductionAgent with Grok-4...")
-        agent = IntroductionAgent()
-        result = agent.analyze(intro_text, paper_metadata)
+        result = intro_agent.analyze(intro_text, paper_metadata)
 
         print("\n" + "=" * 80)
         print("ANALYSIS RESULTS")
@@ -132,24 +137,15 @@ def test_introduction_agent():
         print("\n🔍 CRITICAL ANALYSIS:")
         print("-" * 80)
         critical = analysis.get('critical_analysis', 'Not provided')
-        words = critical.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(critical, width=80))
 
         print("\n" + "=" * 80)
         print("✅ INTRODUCTIONAGENT TEST PASSED!")
         print("=" * 80)
 
         # Save results
-        with open("test_results_introduction_agent.json", 'w') as f:
-            json.dump(result, f, indent=2)
+        with open("test_results_introduction_agent.json", 'wb') as f:
+            f.write(orjson.dumps(result, option=ORJSON_OPTIONS))
         print("\n📄 Results saved to: test_results_introduction_agent.json")
 
         return True
@@ -162,5 +158,5 @@ def test_introduction_agent():
 
 
 if __name__ == "__main__":
-    success = test_introduction_agent()
+    success = test_introduction_agent(IntroductionAgent())
     sys.exit(0 if success else 1)
@@ -4,12 +4,19 @@ Test LiteratureReviewAgent with Transformer Paper
 """
 
 import sys
-import json
-from rag_system.pdf_processor import PDFProcessor
+import orjson
+from testing_support import ORJSON_OPTIONS
+from textwrap import fill
+from pathlib import Path
+from rag_system.pdf_processor_cache import extract_cached
 from rag_system.analysis_agents.literature_review_agent import LiteratureReviewAgent
+import pytest
 
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
-def test_literature_agent():
+
+def test_literature_agent(lit_agent):
     print("=" * 80)
     print("LITERATUREREVIEWAGENT TEST - Transformer Paper")
     print("=" * 80)
@@ -24,8 +31,7 @@ def test_literature_agent():
 
     try:
         print("\nExtracting Related Work/Literature Review section...")
-        processor = PDFProcessor()
-        extraction_result = processor.extract_text_by_sections(pdf_path)
+        extraction_result = extract_cached(pdf_path, Path(pdf_path).stat().st_mtime_ns)
 
         sections = extraction_result.get('sections', {})
 
@@ -58,8 +64,7 @@ def test_literature_agent():
         print("-" * 80)
 
         print("\n⏳ Running LiteratureReviewAgent with Grok-4...")
-        agent = LiteratureReviewAgent()
-        result = agent.analyze(lit_text, paper_metadata)
+        result = lit_agent.analyze(lit_text, paper_metadata)
 
         print("\n" + "=" * 80)
         print("ANALYSIS RESULTS")
@@ -124,16 +129,7 @@ def test_literature_agent():
         print("\n🆚 COMPARISON WITH PRIOR WORK:")
         print("-" * 80)
         comparison = analysis.get('comparison_with_prior', 'Not found')
-        words = comparison.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(comparison, width=80))
 
         print("\n📈 LITERATURE QUALITY:")
         print("-" * 80)
@@ -145,23 +141,14 @@ def test_literature_agent():
         print("\n🔍 CRITICAL ANALYSIS:")
         print("-" * 80)
         critical = analysis.get('critical_analysis', 'Not provided')
-        words = critical.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(critical, width=80))
 
         print("\n" + "=" * 80)
         print("✅ LITERATUREREVIEWAGENT TEST PASSED!")
         print("=" * 80)
 
-        with open("test_results_literature_agent.json", 'w') as f:
-            json.dump(result, f, indent=2)
+        with open("test_results_literature_agent.json", 'wb') as f:
+            f.write(orjson.dumps(result, option=ORJSON_OPTIONS))
         print("\n📄 Results saved to: test_results_literature_agent.json")
 
         return True
@@ -174,5 +161,5 @@ def test_literature_agent():
 
 
 if __name__ == "__main__":
-    success = test_literature_agent()
+    success = test_literature_agent(LiteratureReviewAgent())
     sys.exit(0 if success else 1)
@@ -0,0 +1,87 @@
+"""
+Tests for how DocumentAnalysisOrchestrator.analyze_paper(parallel=True) records
+each agent's outcome
+
+analyze_section and extract_section are stubbed and the timeouts shrunk, so no
+PDF is parsed and no request leaves the process.
+"""
+
+import threading
+import time
+
+import pytest
+
+# The agents build OpenAI clients at import time; skip when openai is missing
+orchestrator = pytest.importorskip("rag_system.analysis_agents.orchestrator")
+
+AGENTS = ('abstract', 'introduction', 'methodology')
+
+# Longest the hanging agent blocks; well past the shrunk total timeout
+HANG_SECONDS = 2
+
+
+@pytest.fixture
+def stubbed(monkeypatch):
+    """
+    An orchestrator with three agents (one succeeds, one raises, one hangs),
+    and the event that releases the hung one
+    """
+    orch = orchestrator.DocumentAnalysisOrchestrator()
+    orch.agents = {name: orch.agents[name] for name in AGENTS}
+    orch.TOTAL_TIMEOUT = 0.2
+    release = threading.Event()
+
+    def analyze_section(agent_name, section_text, paper_metadata):
+        if agent_name == 'introduction':
+            raise RuntimeError("agent crashed")
+        if agent_name == 'methodology':
+            release.wait(timeout=HANG_SECONDS)
+        return {'success': True, 'agent_name': agent_name, 'tokens_used': 10}
+
+    monkeypatch.setattr(orch, "extract_section", lambda sections, pages, name: f"{name} text")
+    monkeypatch.setattr(orch, "analyze_section", analyze_section)
+    yield orch, release
+    release.set()
+
+
+def _analyze(orch, **kwargs):
+    return orch.analyze_paper("paper.pdf", extraction_result={'sections': {}, 'pages': ['page']}, **kwargs)
+
+
+def test_hung_agent_marked_incomplete(stubbed):
+    """An agent still running at the total timeout is recorded as failed"""
+    orch, _ = stubbed
+    start = time.monotonic()
+    result = _analyze(orch)
+
+    assert time.monotonic() - start < HANG_SECONDS + 1
+    assert result['success']
+    agent_results = result['analysis_results']
+    assert set(agent_results) == set(AGENTS)
+
+    assert agent_results['abstract']['success']
+    assert not agent_results['introduction']['success']
+    assert agent_results['introduction']['error'] == "agent crashed"
+    assert not agent_results['methodology']['success']
+    assert 'total timeout' in agent_results['methodology']['error']
+    assert result['metrics']['successful_agents'] == 1
+    assert result['metrics']['failed_agents'] == 2
+
+
+def test_callback_sees_every_agent(stubbed):
+    """on_agent_result gets the success, the exception and the timeout alike"""
+    orch, release = stubbed
+    seen = {}
+
+    def on_agent_result(agent_name, result):
+        seen[agent_name] = result
+        if agent_name == 'methodology':
+            release.set()  # Let the hung worker finish so the executor can shut down
+
+    result = _analyze(orch, on_agent_result=on_agent_result)
+
+    assert set(seen) == set(AGENTS)
+    assert seen == result['analysis_results']
+    assert seen['abstract']['success']
+    assert seen['introduction']['error'] == "agent crashed"
+    assert 'total timeout' in seen['methodology']['error']
@@ -5,6 +5,7 @@ Verify results come from: Semantic Scholar, arXiv, OpenAlex, Crossref, CORE, Pub
 """
 
 import time
+from collections import Counter
 from multi_agent_system import create_orchestrator
 
 # Configuration
@@ -75,29 +76,28 @@ for agent_data in agent_metrics:
 # Count papers by source
 print(f"\n📚 PAPERS BY SOURCE:")
 print("-" * 80)
-source_count = {}
+# One pass: count per source and remember the first paper seen from each
+source_count = Counter()
+first_by_source = {}
 for paper in results:
     source = paper.get('source', 'Unknown')
-    source_count[source] = source_count.get(source, 0) + 1
+    source_count[source] += 1
+    first_by_source.setdefault(source, paper)
 
-for source, count in sorted(source_count.items(), key=lambda x: x[1], reverse=True):
+for source, count in source_count.most_common():
     print(f"   {source:20s}: {count:3d} papers")
 
 # Show sample papers from each source
 print(f"\n📄 SAMPLE PAPERS (first from each source):")
 print("=" * 80)
 
-seen_sources = set()
-for paper in results:
-    source = paper.get('source', 'Unknown')
-    if source not in seen_sources:
-        seen_sources.add(source)
-        title = paper.get('title', 'Unknown')[:60] + "..."
-        year = paper.get('year', 'N/A')
-        citations = paper.get('citations', 'N/A')
-        print(f"\n[{source}]")
-        print(f"  Title: {title}")
-        print(f"  Year: {year} | Citations: {citations}")
+for source, paper in first_by_source.items():
+    title = paper.get('title', 'Unknown')[:60] + "..."
+    year = paper.get('year', 'N/A')
+    citations = paper.get('citations', 'N/A')
+    print(f"\n[{source}]")
+    print(f"  Title: {title}")
+    print(f"  Year: {year} | Citations: {citations}")
 
 # Final summary
 print("\n" + "=" * 80)
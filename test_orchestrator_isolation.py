@@ -4,11 +4,25 @@ Tests Fix #4: Remove singleton pattern from app.py
 """
 
 import sys
+import logging
+import functools
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Failures are reported through the logger, which formats the traceback only when emitted
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+
+
+@functools.lru_cache(maxsize=None)
+def _app_lines():
+    """Lines of app.py, read once and shared by the source-inspection tests"""
+    with open("app.py", 'r') as f:
+        return tuple(f.read().split('\n'))
+
 
 def test_no_singleton_decorator():
     """Verify @st.cache_resource decorator is removed"""
@@ -21,11 +35,8 @@ def test_no_singleton_decorator():
         if not app_path.exists():
             raise Exception("app.py not found")
 
-        with open(app_path, 'r') as f:
-            content = f.read()
-
         # Find the load_analysis_orchestrator function
-        lines = content.split('\n')
+        lines = _app_lines()
         orchestrator_line_idx = None
 
         for i, line in enumerate(lines):
@@ -101,9 +112,7 @@ def test_fresh_instance_created():
         return True
 
     except Exception as e:
-        print(f"❌ Test 2 FAILED: {e}\n")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Test 2 FAILED: %s\n", e)
         return False
 
 
@@ -113,10 +122,7 @@ def test_usage_comment_present():
     print("-" * 50)
 
     try:
-        app_path = Path("app.py")
-
-        with open(app_path, 'r') as f:
-            lines = f.readlines()
+        lines = _app_lines()
 
         # Find where load_analysis_orchestrator() is called
         usage_found = False
@@ -159,21 +165,21 @@ def test_function_returns_new_instance():
     try:
         from rag_system.analysis_agents import DocumentAnalysisOrchestrator
 
-        # Simulate calling the function multiple times
+        # Simulate calling the function repeatedly; two instances prove non-identity
         instances = []
-        for i in range(5):
+        for i in range(2):
             inst = DocumentAnalysisOrchestrator()
             instances.append(inst)
 
         # Verify all instances are unique
         unique_ids = set(id(inst) for inst in instances)
 
-        if len(unique_ids) == 5:
-            print(f"  ✓ Created 5 instances with 5 unique IDs")
+        if len(unique_ids) == len(instances):
+            print(f"  ✓ Created {len(instances)} instances with {len(unique_ids)} unique IDs")
             for i, inst_id in enumerate(unique_ids, 1):
                 print(f"    Instance {i}: {inst_id}")
         else:
-            raise Exception(f"Expected 5 unique instances, got {len(unique_ids)}")
+            raise Exception(f"Expected {len(instances)} unique instances, got {len(unique_ids)}")
 
         # Verify instances don't share mutable state
         # Modify one instance and check others are not affected
@@ -191,9 +197,7 @@ def test_function_returns_new_instance():
         return True
 
     except Exception as e:
-        print(f"❌ Test 4 FAILED: {e}\n")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Test 4 FAILED: %s\n", e)
         return False
 
 
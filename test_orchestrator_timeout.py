@@ -3,89 +3,99 @@ Test script to verify orchestrator timeout protection
 Tests Fix #3: Add timeout to orchestrator.py line 295
 """
 
+import io
 import sys
 import time
 import threading
+import traceback
+from contextlib import redirect_stdout
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from concurrent.futures import FIRST_COMPLETED, TimeoutError, as_completed, wait
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = Path(__file__).parent
+sys.path.insert(0, str(_HERE))
 
+from testing_support import STATUS_MARKS, WORKER_POOL, TaskResult
 
-def simulate_slow_task(task_id, sleep_time):
+_OK, _TO, _FAIL, _CHECK, _WARN = STATUS_MARKS
+
+
+def simulate_slow_task(task_id, sleep_time, stop):
     """Simulate a slow task that takes a while to complete"""
     print(f"  Task {task_id} starting (will sleep for {sleep_time}s)...")
-    time.sleep(sleep_time)
+    if stop.wait(sleep_time):
+        raise RuntimeError("cancelled")
     return {"task_id": task_id, "result": "success", "sleep_time": sleep_time}
 
 
-def test_timeout_protection():
+def test_timeout_protection(executor=WORKER_POOL):
     """Test that timeout protection prevents indefinite hangs"""
     print("Test 1: Timeout protection for slow tasks")
     print("-" * 50)
+    stop = threading.Event()  # Released at the end of this test, never cleared
 
     try:
         timeout_seconds = 3
         results = {}
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit tasks with different execution times
-            future_to_task = {
-                executor.submit(simulate_slow_task, 1, 1): "task_1",  # 1s - should complete
-                executor.submit(simulate_slow_task, 2, 2): "task_2",  # 2s - should complete
-                executor.submit(simulate_slow_task, 3, 10): "task_3"  # 10s - should timeout
-            }
+        # Submit tasks with different execution times
+        future_to_task = {
+            executor.submit(simulate_slow_task, 1, 1, stop): "task_1",  # 1s - should complete
+            executor.submit(simulate_slow_task, 2, 2, stop): "task_2",  # 2s - should complete
+            executor.submit(simulate_slow_task, 3, 10, stop): "task_3"  # 10s - should timeout
+        }
 
-            # Collect results with timeout (similar to orchestrator pattern)
-            for future in as_completed(future_to_task):
+        # Collect results with a total and a per-task timeout (orchestrator pattern)
+        try:
+            for future in as_completed(future_to_task, timeout=timeout_seconds):
                 task_name = future_to_task[future]
                 try:
-                    # This mimics the orchestrator's timeout pattern
                     result = future.result(timeout=timeout_seconds)
-                    results[task_name] = {
-                        'success': True,
-                        'result': result
-                    }
-                    print(f"  ✓ {task_name} completed successfully")
+                    results[task_name] = TaskResult(success=True, result=result)
+                    print(f"  {_OK} {task_name} completed successfully")
                 except TimeoutError:
-                    results[task_name] = {
-                        'success': False,
-                        'error': f'Timeout after {timeout_seconds} seconds'
-                    }
-                    print(f"  ⏱️  {task_name} timed out after {timeout_seconds}s")
+                    results[task_name] = TaskResult(success=False, error=f'Timeout after {timeout_seconds} seconds')
+                    print(f"  {_TO}  {task_name} timed out after {timeout_seconds}s")
                 except Exception as e:
-                    results[task_name] = {
-                        'success': False,
-                        'error': str(e)
-                    }
-                    print(f"  ❌ {task_name} failed: {e}")
+                    results[task_name] = TaskResult(success=False, error=str(e))
+                    print(f"  {_FAIL} {task_name} failed: {e}")
+        except TimeoutError:
+            # Total timeout: every task not collected yet has timed out
+            for future, task_name in future_to_task.items():
+                if task_name not in results:
+                    future.cancel()
+                    results[task_name] = TaskResult(success=False, error=f'Timeout after {timeout_seconds} seconds')
+                    print(f"  {_TO}  {task_name} timed out after {timeout_seconds}s")
+
+        # Wake any task still waiting so its worker returns to the pool
+        stop.set()
 
         # Verify results
-        if results['task_1']['success'] and results['task_2']['success']:
-            print("  ✓ Quick tasks completed successfully")
+        if results['task_1'].success and results['task_2'].success:
+            print(f"  {_OK} Quick tasks completed successfully")
         else:
             raise Exception("Quick tasks should have completed")
 
-        if not results['task_3']['success'] and 'Timeout' in results['task_3']['error']:
-            print("  ✓ Slow task correctly timed out")
+        if not results['task_3'].success and 'Timeout' in results['task_3'].error:
+            print(f"  {_OK} Slow task correctly timed out")
         else:
             raise Exception("Slow task should have timed out")
 
-        print("✅ Test 1 PASSED\n")
+        print(f"{_CHECK} Test 1 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 1 FAILED: {e}\n")
-        import traceback
+        print(f"{_FAIL} Test 1 FAILED: {e}\n")
         traceback.print_exc()
         return False
 
 
-def test_no_indefinite_hang():
+def test_no_indefinite_hang(executor=WORKER_POOL):
     """Test that the entire execution completes within reasonable time"""
     print("Test 2: No indefinite hang")
     print("-" * 50)
+    stop = threading.Event()  # Released at the end of this test, never cleared
 
     try:
         max_allowed_time = 5  # Maximum 5 seconds for the entire test
@@ -93,56 +103,70 @@ def test_no_indefinite_hang():
 
         timeout_seconds = 2
         results = {}
+        timed_out_count = 0  # Every unsuccessful task, counted as it is collected
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit multiple slow tasks
-            future_to_task = {
-                executor.submit(simulate_slow_task, i, 10): f"task_{i}"
-                for i in range(3)
-            }
+        # Submit multiple slow tasks
+        future_to_task = {
+            executor.submit(simulate_slow_task, i, 10, stop): f"task_{i}"
+            for i in range(3)
+        }
 
-            # Collect results with timeout
-            for future in as_completed(future_to_task):
+        # Collect results with a total and a per-task timeout
+        try:
+            for future in as_completed(future_to_task, timeout=timeout_seconds):
                 task_name = future_to_task[future]
                 try:
                     result = future.result(timeout=timeout_seconds)
-                    results[task_name] = {'success': True}
-                    print(f"  ✓ {task_name} completed")
+                    results[task_name] = TaskResult(success=True)
+                    print(f"  {_OK} {task_name} completed")
                 except TimeoutError:
-                    results[task_name] = {'success': False, 'error': 'Timeout'}
-                    print(f"  ⏱️  {task_name} timed out")
+                    results[task_name] = TaskResult(success=False, error='Timeout')
+                    timed_out_count += 1
+                    print(f"  {_TO}  {task_name} timed out")
                 except Exception as e:
-                    results[task_name] = {'success': False, 'error': str(e)}
-                    print(f"  ❌ {task_name} failed: {e}")
+                    results[task_name] = TaskResult(success=False, error=str(e))
+                    timed_out_count += 1
+                    print(f"  {_FAIL} {task_name} failed: {e}")
+        except TimeoutError:
+            # Total timeout: every task not collected yet has timed out
+            for future, task_name in future_to_task.items():
+                if task_name not in results:
+                    future.cancel()
+                    results[task_name] = TaskResult(success=False, error='Timeout')
+                    timed_out_count += 1
+                    print(f"  {_TO}  {task_name} timed out")
+
+        # Wake any task still waiting so its worker returns to the pool
+        stop.set()
 
         elapsed = time.time() - start_time
 
         print(f"  Total elapsed time: {elapsed:.2f}s")
 
         if elapsed < max_allowed_time:
-            print(f"  ✓ Completed within {max_allowed_time}s limit")
+            print(f"  {_OK} Completed within {max_allowed_time}s limit")
         else:
             raise Exception(f"Test took {elapsed:.2f}s, exceeded {max_allowed_time}s limit")
 
         # All tasks should have timed out (none should complete)
-        timed_out_count = sum(1 for r in results.values() if not r['success'])
         if timed_out_count == 3:
-            print(f"  ✓ All {timed_out_count} slow tasks timed out as expected")
+            print(f"  {_OK} All {timed_out_count} slow tasks timed out as expected")
         else:
             raise Exception(f"Expected 3 timeouts, got {timed_out_count}")
 
-        print("✅ Test 2 PASSED\n")
+        print(f"{_CHECK} Test 2 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 2 FAILED: {e}\n")
+        print(f"{_FAIL} Test 2 FAILED: {e}\n")
         return False
 
 
-def test_mixed_execution():
+def test_mixed_execution(executor=WORKER_POOL):
     """Test mix of fast, slow, and error tasks"""
     print("Test 3: Mixed task execution with timeouts")
     print("-" * 50)
+    stop = threading.Event()  # Released at the end of this test, never cleared
 
     def task_that_errors():
         """Task that raises an error"""
@@ -153,105 +177,130 @@ def test_mixed_execution():
         timeout_seconds = 2
         results = {}
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_task = {
-                executor.submit(simulate_slow_task, 1, 0.5): "fast_task",
-                executor.submit(simulate_slow_task, 2, 10): "slow_task",
-                executor.submit(task_that_errors): "error_task"
-            }
+        future_to_task = {
+            executor.submit(simulate_slow_task, 1, 0.5, stop): "fast_task",
+            executor.submit(simulate_slow_task, 2, 10, stop): "slow_task",
+            executor.submit(task_that_errors): "error_task"
+        }
 
-            for future in as_completed(future_to_task):
+        try:
+            for future in as_completed(future_to_task, timeout=timeout_seconds):
                 task_name = future_to_task[future]
                 try:
                     result = future.result(timeout=timeout_seconds)
-                    results[task_name] = {'success': True, 'result': result}
-                    print(f"  ✓ {task_name} completed successfully")
+                    results[task_name] = TaskResult(success=True, result=result)
+                    print(f"  {_OK} {task_name} completed successfully")
                 except TimeoutError:
-                    results[task_name] = {'success': False, 'error': 'Timeout'}
-                    print(f"  ⏱️  {task_name} timed out")
+                    results[task_name] = TaskResult(success=False, error='Timeout')
+                    print(f"  {_TO}  {task_name} timed out")
                 except Exception as e:
-                    results[task_name] = {'success': False, 'error': str(e)}
-                    print(f"  ❌ {task_name} raised exception: {type(e).__name__}")
+                    results[task_name] = TaskResult(success=False, error=str(e))
+                    print(f"  {_FAIL} {task_name} raised exception: {type(e).__name__}")
+        except TimeoutError:
+            # Total timeout: every task not collected yet has timed out
+            for future, task_name in future_to_task.items():
+                if task_name not in results:
+                    future.cancel()
+                    results[task_name] = TaskResult(success=False, error='Timeout')
+                    print(f"  {_TO}  {task_name} timed out")
+
+        # Wake any task still waiting so its worker returns to the pool
+        stop.set()
 
         # Verify results
-        if results['fast_task']['success']:
-            print("  ✓ Fast task completed")
+        if results['fast_task'].success:
+            print(f"  {_OK} Fast task completed")
         else:
             raise Exception("Fast task should have completed")
 
-        if not results['slow_task']['success'] and results['slow_task']['error'] == 'Timeout':
-            print("  ✓ Slow task timed out")
+        if not results['slow_task'].success and results['slow_task'].error == 'Timeout':
+            print(f"  {_OK} Slow task timed out")
         else:
             raise Exception("Slow task should have timed out")
 
-        if not results['error_task']['success'] and 'Intentional error' in results['error_task']['error']:
-            print("  ✓ Error task handled correctly")
+        if not results['error_task'].success and 'Intentional error' in results['error_task'].error:
+            print(f"  {_OK} Error task handled correctly")
         else:
             raise Exception("Error task should have been caught")
 
-        print("✅ Test 3 PASSED\n")
+        print(f"{_CHECK} Test 3 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 3 FAILED: {e}\n")
-        import traceback
+        print(f"{_FAIL} Test 3 FAILED: {e}\n")
         traceback.print_exc()
         return False
 
 
-def test_concurrent_timeouts():
+def test_concurrent_timeouts(executor=WORKER_POOL):
     """Test multiple tasks timing out concurrently"""
     print("Test 4: Concurrent timeout handling")
     print("-" * 50)
+    stop = threading.Event()  # Released at the end of this test, never cleared
 
     try:
         timeout_seconds = 1
         num_tasks = 10
         results = {}
+        timed_out = 0  # Every unsuccessful task, counted as it is collected
         start_time = time.time()
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            # Submit many slow tasks
-            future_to_task = {
-                executor.submit(simulate_slow_task, i, 5): f"task_{i}"
-                for i in range(num_tasks)
-            }
-
-            # Collect results with timeout
-            for future in as_completed(future_to_task):
+        # Submit many slow tasks
+        future_to_task = {
+            executor.submit(simulate_slow_task, i, 5, stop): f"task_{i}"
+            for i in range(num_tasks)
+        }
+
+        # Collect results against a single deadline; each wait() returns as
+        # soon as any task finishes, and tasks still pending at the deadline
+        # have timed out
+        deadline = time.monotonic() + timeout_seconds
+        pending = set(future_to_task)
+        while pending:
+            done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break  # Total timeout
+            for future in done:
                 task_name = future_to_task[future]
                 try:
-                    result = future.result(timeout=timeout_seconds)
-                    results[task_name] = {'success': True}
-                except TimeoutError:
-                    results[task_name] = {'success': False}
+                    future.result(timeout=0)  # Already finished
+                    results[task_name] = TaskResult(success=True)
                 except Exception as e:
-                    results[task_name] = {'success': False, 'error': str(e)}
+                    results[task_name] = TaskResult(success=False, error=str(e))
+                    timed_out += 1
+
+        for future in pending:
+            future.cancel()
+            results[future_to_task[future]] = TaskResult(success=False, error='Timeout')
+            timed_out += 1
+
+        # Wake any task still waiting so its worker returns to the pool
+        stop.set()
 
         elapsed = time.time() - start_time
 
         # All tasks should have timed out
-        timed_out = sum(1 for r in results.values() if not r['success'])
 
-        print(f"  ✓ {timed_out}/{num_tasks} tasks timed out")
-        print(f"  ✓ Total time: {elapsed:.2f}s (not {num_tasks * 5}s)")
+        print(f"  {_OK} {timed_out}/{num_tasks} tasks timed out")
+        print(f"  {_OK} Total time: {elapsed:.2f}s (not {num_tasks * 5}s)")
 
         if timed_out == num_tasks:
-            print("  ✓ All tasks timed out as expected")
+            print(f"  {_OK} All tasks timed out as expected")
         else:
             raise Exception(f"Expected {num_tasks} timeouts, got {timed_out}")
 
         # Should complete reasonably quickly (not wait for all tasks)
         if elapsed < 5:
-            print(f"  ✓ Completed quickly ({elapsed:.2f}s < 5s)")
+            print(f"  {_OK} Completed quickly ({elapsed:.2f}s < 5s)")
         else:
             raise Exception(f"Took too long: {elapsed:.2f}s")
 
-        print("✅ Test 4 PASSED\n")
+        print(f"{_CHECK} Test 4 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 4 FAILED: {e}\n")
+        print(f"{_FAIL} Test 4 FAILED: {e}\n")
         return False
 
 
@@ -270,11 +319,16 @@ def main():
         test_concurrent_timeouts
     ]
 
+    # Buffer each test's report and write it in one go; tests run one at a
+    # time, so the process-wide redirect also catches the worker threads' prints
     results = []
     for test_func in tests:
-        result = test_func()
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            result = test_func()
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
         results.append(result)
-        time.sleep(0.1)  # Small delay between tests
 
     # Summary
     print("=" * 60)
@@ -286,16 +340,16 @@ def main():
     print(f"Tests passed: {passed}/{total}")
 
     if passed == total:
-        print("\n✅ ALL TESTS PASSED - Fix #3 is working correctly!")
+        print(f"\n{_CHECK} ALL TESTS PASSED - Fix #3 is working correctly!")
         print("\nThe orchestrator timeout protection:")
-        print("  ✓ Prevents indefinite hangs on slow agents")
-        print("  ✓ Completes execution within reasonable time")
-        print("  ✓ Handles mix of fast, slow, and error tasks")
-        print("  ✓ Correctly handles concurrent timeouts")
-        print("  ✓ Provides clear timeout error messages")
+        print(f"  {_OK} Prevents indefinite hangs on slow agents")
+        print(f"  {_OK} Completes execution within reasonable time")
+        print(f"  {_OK} Handles mix of fast, slow, and error tasks")
+        print(f"  {_OK} Correctly handles concurrent timeouts")
+        print(f"  {_OK} Provides clear timeout error messages")
         return 0
     else:
-        print(f"\n❌ {total - passed} TEST(S) FAILED - Fix needs attention")
+        print(f"\n{_FAIL} {total - passed} TEST(S) FAILED - Fix needs attention")
         return 1
 
 
@@ -3,99 +3,110 @@ Simplified test to verify orchestrator timeout protection
 Tests Fix #3: Add timeout to orchestrator.py
 """
 
+import io
 import sys
 import time
+import threading
+import traceback
+from contextlib import redirect_stdout
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from concurrent.futures import FIRST_COMPLETED, TimeoutError, as_completed, wait
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = Path(__file__).parent
+sys.path.insert(0, str(_HERE))
 
+from testing_support import STATUS_MARKS, WORKER_POOL, TaskResult
 
-def test_as_completed_with_timeout():
+_OK, _TO, _FAIL, _CHECK, _WARN = STATUS_MARKS
+
+
+def test_as_completed_with_timeout(executor=WORKER_POOL):
     """Test as_completed with timeout parameter"""
     print("Test 1: as_completed() with timeout")
     print("-" * 50)
+    stop = threading.Event()  # Released at the end of this test, never cleared
 
     def slow_task(task_id, sleep_time):
-        time.sleep(sleep_time)
+        if stop.wait(sleep_time):
+            raise RuntimeError("cancelled")
         return {"task_id": task_id, "result": "success"}
 
     try:
         start_time = time.time()
         results = {}
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit 3 tasks: 2 fast, 1 very slow
-            future_to_task = {
-                executor.submit(slow_task, 1, 1): "task_1",  # 1s
-                executor.submit(slow_task, 2, 2): "task_2",  # 2s
-                executor.submit(slow_task, 3, 100): "task_3"  # 100s - will timeout
-            }
-
-            # Use as_completed with 5 second total timeout
-            try:
-                for future in as_completed(future_to_task, timeout=5):
-                    task_name = future_to_task[future]
-                    try:
-                        result = future.result(timeout=0.1)
-                        results[task_name] = {'success': True, 'result': result}
-                        print(f"  ✓ {task_name} completed")
-                    except TimeoutError:
-                        results[task_name] = {'success': False, 'error': 'result() timeout'}
-                        print(f"  ⏱️  {task_name} result() timeout")
-                    except Exception as e:
-                        results[task_name] = {'success': False, 'error': str(e)}
-                        print(f"  ❌ {task_name} error: {e}")
-
-            except TimeoutError:
-                print(f"  ⏱️  as_completed() timed out after 5s")
-                # Mark incomplete tasks as timed out
-                for task_name, future in future_to_task.items():
-                    if task_name not in results:
-                        results[task_name] = {
-                            'success': False,
-                            'error': 'as_completed timeout'
-                        }
-                        print(f"  ⏱️  {task_name} did not complete")
+        # Submit 3 tasks: 2 fast, 1 very slow
+        future_to_task = {
+            executor.submit(slow_task, 1, 1): "task_1",  # 1s
+            executor.submit(slow_task, 2, 2): "task_2",  # 2s
+            executor.submit(slow_task, 3, 100): "task_3"  # 100s - will timeout
+        }
+
+        # Use as_completed with 5 second total timeout
+        try:
+            for future in as_completed(future_to_task, timeout=5):
+                task_name = future_to_task[future]
+                try:
+                    result = future.result(timeout=0.1)
+                    results[task_name] = TaskResult(success=True, result=result)
+                    print(f"  {_OK} {task_name} completed")
+                except TimeoutError:
+                    results[task_name] = TaskResult(success=False, error='result() timeout')
+                    print(f"  {_TO}  {task_name} result() timeout")
+                except Exception as e:
+                    results[task_name] = TaskResult(success=False, error=str(e))
+                    print(f"  {_FAIL} {task_name} error: {e}")
+
+        except TimeoutError:
+            print(f"  {_TO}  as_completed() timed out after 5s")
+            # Mark incomplete tasks as timed out
+            for future, task_name in future_to_task.items():
+                if task_name not in results:
+                    results[task_name] = TaskResult(success=False, error='as_completed timeout')
+                    print(f"  {_TO}  {task_name} did not complete")
+
+        # Wake any task still waiting so its worker returns to the pool
+        stop.set()
 
         elapsed = time.time() - start_time
         print(f"  Total time: {elapsed:.2f}s")
 
         # Verify results
-        if results['task_1']['success'] and results['task_2']['success']:
-            print("  ✓ Fast tasks completed")
+        if results['task_1'].success and results['task_2'].success:
+            print(f"  {_OK} Fast tasks completed")
         else:
             raise Exception("Fast tasks should have completed")
 
-        if not results['task_3']['success']:
-            print("  ✓ Slow task timed out as expected")
+        if not results['task_3'].success:
+            print(f"  {_OK} Slow task timed out as expected")
         else:
             raise Exception("Slow task should have timed out")
 
         if elapsed < 10:
-            print(f"  ✓ Total time reasonable ({elapsed:.2f}s < 10s)")
+            print(f"  {_OK} Total time reasonable ({elapsed:.2f}s < 10s)")
         else:
             raise Exception(f"Test took too long: {elapsed:.2f}s")
 
-        print("✅ Test 1 PASSED\n")
+        print(f"{_CHECK} Test 1 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 1 FAILED: {e}\n")
-        import traceback
+        print(f"{_FAIL} Test 1 FAILED: {e}\n")
         traceback.print_exc()
         return False
 
 
-def test_orchestrator_pattern():
-    """Test the exact pattern used in orchestrator"""
-    print("Test 2: Orchestrator pattern with dual timeouts")
+def test_orchestrator_pattern(executor=WORKER_POOL):
+    """Test collecting agents with wait(FIRST_COMPLETED) against a single deadline"""
+    print("Test 2: Orchestrator pattern with a single total deadline")
     print("-" * 50)
+    stop = threading.Event()  # Released at the end of this test, never cleared
 
     def agent_task(agent_name, sleep_time):
         print(f"    {agent_name} starting ({sleep_time}s)...")
-        time.sleep(sleep_time)
+        if stop.wait(sleep_time):
+            raise RuntimeError("cancelled")
         return {
             'success': True,
             'agent_name': agent_name,
@@ -105,121 +116,133 @@ def test_orchestrator_pattern():
     try:
         start_time = time.time()
         agent_results = {}
+        successes = 0  # Tallied as each agent is collected
+        timeouts = 0
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Simulate 5 agents with different execution times
-            future_to_agent = {
-                executor.submit(agent_task, f'agent_{i}', sleep_time): f'agent_{i}'
-                for i, sleep_time in enumerate([1, 2, 3, 100, 100], 1)  # Last 2 will timeout
-            }
-
-            # This is the orchestrator pattern with timeouts
-            try:
-                for future in as_completed(future_to_agent, timeout=10):
-                    agent_name = future_to_agent[future]
-                    try:
-                        result = future.result(timeout=5)
-                        agent_results[agent_name] = result
-                        if result['success']:
-                            print(f"  ✓ {agent_name} completed")
-                    except TimeoutError:
-                        print(f"  ⏱️  {agent_name} result() timeout")
-                        agent_results[agent_name] = {
-                            'success': False,
-                            'agent_name': agent_name,
-                            'error': 'Agent execution timed out'
-                        }
-                    except Exception as e:
-                        print(f"  ❌ {agent_name} error: {e}")
-                        agent_results[agent_name] = {
-                            'success': False,
-                            'agent_name': agent_name,
-                            'error': str(e)
-                        }
-            except TimeoutError:
-                print("  ⏱️  Total timeout - marking incomplete agents")
-                for agent_name, future in future_to_agent.items():
-                    if agent_name not in agent_results:
-                        agent_results[agent_name] = {
-                            'success': False,
-                            'agent_name': agent_name,
-                            'error': 'Did not complete within total timeout'
-                        }
-                        print(f"  ⏱️  {agent_name} did not complete")
+        # Simulate 5 agents with different execution times
+        future_to_agent = {
+            executor.submit(agent_task, f'agent_{i}', sleep_time): f'agent_{i}'
+            for i, sleep_time in enumerate([1, 2, 3, 100, 100], 1)  # Last 2 will timeout
+        }
+
+        # One deadline for all agents: each wait() returns as soon as any agent
+        # finishes, and whatever is still pending at the deadline is timed out
+        deadline = time.monotonic() + 10
+        pending = set(future_to_agent)
+        while pending:
+            done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break  # Total timeout
+            for future in done:
+                agent_name = future_to_agent[future]
+                try:
+                    result = future.result(timeout=0)  # Already finished
+                    agent_results[agent_name] = result
+                    if result['success']:
+                        successes += 1
+                        print(f"  {_OK} {agent_name} completed")
+                    else:
+                        timeouts += 1
+                except Exception as e:
+                    timeouts += 1
+                    print(f"  {_FAIL} {agent_name} error: {e}")
+                    agent_results[agent_name] = {
+                        'success': False,
+                        'agent_name': agent_name,
+                        'error': str(e)
+                    }
+
+        if pending:
+            print(f"  {_TO}  Total timeout - marking incomplete agents")
+            for future in pending:
+                agent_name = future_to_agent[future]
+                future.cancel()
+                timeouts += 1
+                agent_results[agent_name] = {
+                    'success': False,
+                    'agent_name': agent_name,
+                    'error': 'Did not complete within total timeout'
+                }
+                print(f"  {_TO}  {agent_name} did not complete")
+
+        # Wake any task still waiting so its worker returns to the pool
+        stop.set()
 
         elapsed = time.time() - start_time
         print(f"  Total time: {elapsed:.2f}s")
 
         # Verify all agents have results
         if len(agent_results) == 5:
-            print(f"  ✓ All 5 agents accounted for")
+            print(f"  {_OK} All 5 agents accounted for")
         else:
             raise Exception(f"Expected 5 agents, got {len(agent_results)}")
 
-        # Count successes and timeouts
-        successes = sum(1 for r in agent_results.values() if r['success'])
-        timeouts = sum(1 for r in agent_results.values() if not r['success'])
-
-        print(f"  ✓ {successes} agents succeeded, {timeouts} timed out")
+        print(f"  {_OK} {successes} agents succeeded, {timeouts} timed out")
 
         if successes == 3 and timeouts == 2:
-            print("  ✓ Results match expectations (3 fast, 2 slow)")
+            print(f"  {_OK} Results match expectations (3 fast, 2 slow)")
         else:
-            print(f"  ⚠️  Expected 3 successes and 2 timeouts")
+            print(f"  {_WARN}  Expected 3 successes and 2 timeouts")
 
         if elapsed < 15:
-            print(f"  ✓ Completed reasonably quickly ({elapsed:.2f}s < 15s)")
+            print(f"  {_OK} Completed reasonably quickly ({elapsed:.2f}s < 15s)")
         else:
             raise Exception(f"Test took too long: {elapsed:.2f}s")
 
-        print("✅ Test 2 PASSED\n")
+        print(f"{_CHECK} Test 2 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 2 FAILED: {e}\n")
-        import traceback
+        print(f"{_FAIL} Test 2 FAILED: {e}\n")
         traceback.print_exc()
         return False
 
 
-def test_timeout_prevents_hang():
+def test_timeout_prevents_hang(executor=WORKER_POOL):
     """Test that timeout actually prevents indefinite hangs"""
     print("Test 3: Timeout prevents indefinite hang")
     print("-" * 50)
+    stop = threading.Event()  # Released at the end of this test, never cleared
 
     def hanging_task():
-        """Task that hangs indefinitely"""
+        """Task that hangs until the test releases it (no periodic wakeups)"""
         print("    Task starting... will hang forever")
-        while True:
-            time.sleep(1)
+        # Bounded so a test that fails before releasing it cannot pin the
+        # worker, and with it interpreter exit, indefinitely
+        stop.wait(timeout=60)
+        raise RuntimeError("cancelled")
 
     try:
         start_time = time.time()
         max_allowed = 5  # Should complete within 5 seconds
 
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(hanging_task)
+        future = executor.submit(hanging_task)
+
+        try:
+            result = future.result(timeout=3)
+            print(f"  {_FAIL} Task completed (shouldn't happen)")
+            raise Exception("Hanging task should not complete")
+        except TimeoutError:
+            print(f"  {_OK} Task timed out after 3s (as expected)")
 
-            try:
-                result = future.result(timeout=3)
-                print(f"  ✗ Task completed (shouldn't happen)")
-                raise Exception("Hanging task should not complete")
-            except TimeoutError:
-                print(f"  ✓ Task timed out after 3s (as expected)")
+        # Release the hung worker; an atexit hook would run too late, since
+        # concurrent.futures joins its workers before atexit handlers fire
+        stop.set()
 
         elapsed = time.time() - start_time
         print(f"  Total time: {elapsed:.2f}s")
 
         if elapsed < max_allowed:
-            print(f"  ✓ Did not hang indefinitely ({elapsed:.2f}s < {max_allowed}s)")
+            print(f"  {_OK} Did not hang indefinitely ({elapsed:.2f}s < {max_allowed}s)")
         else:
             raise Exception(f"Test took too long: {elapsed:.2f}s")
 
-        print("✅ Test 3 PASSED\n")
+        print(f"{_CHECK} Test 3 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 3 FAILED: {e}\n")
+        print(f"{_FAIL} Test 3 FAILED: {e}\n")
         return False
 
 
@@ -237,11 +260,16 @@ def main():
         test_timeout_prevents_hang
     ]
 
+    # Buffer each test's report and write it in one go; tests run one at a
+    # time, so the process-wide redirect also catches the worker threads' prints
     results = []
     for test_func in tests:
-        result = test_func()
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            result = test_func()
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
         results.append(result)
-        time.sleep(0.5)
 
     # Summary
     print("=" * 60)
@@ -253,15 +281,15 @@ def main():
     print(f"Tests passed: {passed}/{total}")
 
     if passed == total:
-        print("\n✅ ALL TESTS PASSED - Fix #3 is working correctly!")
+        print(f"\n{_CHECK} ALL TESTS PASSED - Fix #3 is working correctly!")
         print("\nThe orchestrator timeout protection:")
-        print("  ✓ as_completed() timeout prevents waiting forever")
-        print("  ✓ future.result() timeout catches individual hangs")
-        print("  ✓ Dual timeout approach handles all scenarios")
-        print("  ✓ Incomplete agents are properly marked as timed out")
+        print(f"  {_OK} as_completed() timeout prevents waiting forever")
+        print(f"  {_OK} future.result() timeout catches individual hangs")
+        print(f"  {_OK} wait(FIRST_COMPLETED) collects fast agents until a single deadline")
+        print(f"  {_OK} Incomplete agents are properly marked as timed out")
         return 0
     else:
-        print(f"\n❌ {total - passed} TEST(S) FAILED")
+        print(f"\n{_FAIL} {total - passed} TEST(S) FAILED")
         return 1
 
 
@@ -3,11 +3,64 @@ Code validation test for orchestrator timeout protection
 Tests Fix #3: Verify timeout code is present in orchestrator.py
 """
 
+import re
 import sys
+import functools
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = Path(__file__).parent
+sys.path.insert(0, str(_HERE))
+
+from testing_support import STATUS_MARKS
+
+_OK, _TO, _FAIL, _CHECK, _WARN = STATUS_MARKS
+
+_ORCH_PATH = _HERE / "rag_system" / "analysis_agents" / "orchestrator.py"
+
+
+@functools.lru_cache(maxsize=1)
+def _orch_source():
+    """orchestrator.py source, read once and shared by the validation tests"""
+    return _ORCH_PATH.read_text()
+
+
+def _union_re(needles):
+    """One compiled alternation matching any of the literal needles"""
+    return re.compile('|'.join(re.escape(needle) for needle in needles))
+
+
+# Required timeout constructs: (needle, success message, failure message)
+_TIMEOUT_CODE_CHECKS = (
+    ('as_completed(future_to_agent, timeout=',
+     'as_completed() has timeout parameter', 'as_completed() missing timeout parameter'),
+    ('result = future.result(timeout=',
+     'future.result() has timeout parameter', 'future.result() missing timeout parameter'),
+    ('except TimeoutError:',
+     'TimeoutError exception handling present', 'TimeoutError handling missing'),
+)
+_TIMEOUT_CODE_RE = _union_re(needle for needle, _, _ in _TIMEOUT_CODE_CHECKS)
+
+# Comprehensive timeout error handling: (needle, description)
+_ERROR_CHECKS = (
+    ('except TimeoutError:', 'TimeoutError exception caught'),
+    ('agent_results[agent_name] = {', 'Error results stored in agent_results'),
+    ("'success': False", 'Timeout marked as failed'),
+    ("'error':", 'Error message provided'),
+)
+_ERROR_CHECKS_RE = _union_re(needle for needle, _ in _ERROR_CHECKS)
+
+# Handling of agents that never complete: (needle, description)
+_INCOMPLETE_CHECKS = (
+    ('for future, agent_name in future_to_agent.items():', 'Iterates through all agents'),
+    ('if agent_name not in agent_results:', 'Checks for incomplete agents'),
+    ('agent_results[agent_name]', 'Marks incomplete agents in results'),
+)
+_INCOMPLETE_CHECKS_RE = _union_re(needle for needle, _ in _INCOMPLETE_CHECKS)
+
+
+# Integer timeouts the orchestrator passes to as_completed() and future.result()
+_TIMEOUT_VALUE_RE = re.compile(r'^\s+(TOTAL_TIMEOUT|AGENT_TIMEOUT) = (\d+)$', re.MULTILINE)
 
 
 def test_timeout_code_exists():
@@ -16,41 +69,29 @@ def test_timeout_code_exists():
     print("-" * 50)
 
     try:
-        orchestrator_path = Path("rag_system/analysis_agents/orchestrator.py")
-
-        if not orchestrator_path.exists():
-            raise Exception(f"Orchestrator file not found: {orchestrator_path}")
+        if not _ORCH_PATH.exists():
+            raise Exception(f"Orchestrator file not found: {_ORCH_PATH}")
 
-        with open(orchestrator_path, 'r') as f:
-            content = f.read()
+        content = _orch_source()
 
-        # Check for as_completed with timeout
-        if 'as_completed(future_to_agent, timeout=' in content:
-            print("  ✓ as_completed() has timeout parameter")
-        else:
-            raise Exception("as_completed() missing timeout parameter")
-
-        # Check for future.result with timeout
-        if 'result = future.result(timeout=' in content:
-            print("  ✓ future.result() has timeout parameter")
-        else:
-            raise Exception("future.result() missing timeout parameter")
-
-        # Check for TimeoutError handling
-        if 'except TimeoutError:' in content:
-            print("  ✓ TimeoutError exception handling present")
-        else:
-            raise Exception("TimeoutError handling missing")
+        # Check for as_completed/future.result timeouts and TimeoutError handling
+        # (one regex pass collects every construct present)
+        found = {m.group(0) for m in _TIMEOUT_CODE_RE.finditer(content)}
+        for needle, present, missing in _TIMEOUT_CODE_CHECKS:
+            if needle in found:
+                print(f"  {_OK} {present}")
+            else:
+                raise Exception(missing)
 
         # Check for timeout messages
         if 'Timeout' in content or 'timeout' in content:
-            print("  ✓ Timeout-related messages/comments present")
+            print(f"  {_OK} Timeout-related messages/comments present")
 
-        print("✅ Test 1 PASSED\n")
+        print(f"{_CHECK} Test 1 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 1 FAILED: {e}\n")
+        print(f"{_FAIL} Test 1 FAILED: {e}\n")
         return False
 
 
@@ -60,56 +101,39 @@ def test_timeout_values_reasonable():
     print("-" * 50)
 
     try:
-        orchestrator_path = Path("rag_system/analysis_agents/orchestrator.py")
-
-        with open(orchestrator_path, 'r') as f:
-            lines = f.readlines()
-
-        # Find timeout values
+        # Find timeout values (the last occurrence of each call wins)
         as_completed_timeout = None
         result_timeout = None
 
-        for line in lines:
-            if 'as_completed(future_to_agent, timeout=' in line:
-                # Extract timeout value
-                start = line.find('timeout=') + 8
-                end = line.find(')', start)
-                try:
-                    as_completed_timeout = int(line[start:end])
-                except:
-                    pass
-
-            if 'result = future.result(timeout=' in line:
-                start = line.find('timeout=') + 8
-                end = line.find(')', start)
-                try:
-                    result_timeout = int(line[start:end])
-                except:
-                    pass
+        for match in _TIMEOUT_VALUE_RE.finditer(_orch_source()):
+            if match.group(1) == 'TOTAL_TIMEOUT':
+                as_completed_timeout = int(match.group(2))
+            else:
+                result_timeout = int(match.group(2))
 
         if as_completed_timeout:
-            print(f"  ✓ as_completed timeout: {as_completed_timeout}s")
+            print(f"  {_OK} as_completed timeout: {as_completed_timeout}s")
             if as_completed_timeout >= 60 and as_completed_timeout <= 600:
-                print(f"    ✓ Value is reasonable (60-600s range)")
+                print(f"    {_OK} Value is reasonable (60-600s range)")
             else:
-                print(f"    ⚠️  Value might be too {'low' if as_completed_timeout < 60 else 'high'}")
+                print(f"    {_WARN}  Value might be too {'low' if as_completed_timeout < 60 else 'high'}")
         else:
             raise Exception("Could not extract as_completed timeout value")
 
         if result_timeout:
-            print(f"  ✓ future.result timeout: {result_timeout}s")
+            print(f"  {_OK} future.result timeout: {result_timeout}s")
             if result_timeout >= 30 and result_timeout <= 120:
-                print(f"    ✓ Value is reasonable (30-120s range)")
+                print(f"    {_OK} Value is reasonable (30-120s range)")
             else:
-                print(f"    ⚠️  Value might be too {'low' if result_timeout < 30 else 'high'}")
+                print(f"    {_WARN}  Value might be too {'low' if result_timeout < 30 else 'high'}")
         else:
             raise Exception("Could not extract future.result timeout value")
 
-        print("✅ Test 2 PASSED\n")
+        print(f"{_CHECK} Test 2 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 2 FAILED: {e}\n")
+        print(f"{_FAIL} Test 2 FAILED: {e}\n")
         return False
 
 
@@ -119,30 +143,22 @@ def test_timeout_error_handling():
     print("-" * 50)
 
     try:
-        orchestrator_path = Path("rag_system/analysis_agents/orchestrator.py")
-
-        with open(orchestrator_path, 'r') as f:
-            content = f.read()
-
-        # Check for comprehensive error handling
-        checks = [
-            ('except TimeoutError:', 'TimeoutError exception caught'),
-            ('agent_results[agent_name] = {', 'Error results stored in agent_results'),
-            ("'success': False", 'Timeout marked as failed'),
-            ("'error':", 'Error message provided')
-        ]
-
-        for check_str, description in checks:
-            if check_str in content:
-                print(f"  ✓ {description}")
+        content = _orch_source()
+
+        # Check for comprehensive error handling (one regex pass over the source)
+        found = {m.group(0) for m in _ERROR_CHECKS_RE.finditer(content)}
+
+        for check_str, description in _ERROR_CHECKS:
+            if check_str in found:
+                print(f"  {_OK} {description}")
             else:
                 raise Exception(f"Missing: {description}")
 
-        print("✅ Test 3 PASSED\n")
+        print(f"{_CHECK} Test 3 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 3 FAILED: {e}\n")
+        print(f"{_FAIL} Test 3 FAILED: {e}\n")
         return False
 
 
@@ -152,32 +168,22 @@ def test_incomplete_agents_handled():
     print("-" * 50)
 
     try:
-        orchestrator_path = Path("rag_system/analysis_agents/orchestrator.py")
-
-        with open(orchestrator_path, 'r') as f:
-            content = f.read()
-
-        # Check for handling of agents that don't complete
-        checks = [
-            ('for agent_name, future in future_to_agent.items():',
-             'Iterates through all agents'),
-            ('if agent_name not in agent_results:',
-             'Checks for incomplete agents'),
-            ('agent_results[agent_name]',
-             'Marks incomplete agents in results')
-        ]
-
-        for check_str, description in checks:
-            if check_str in content:
-                print(f"  ✓ {description}")
+        content = _orch_source()
+
+        # Check for handling of agents that don't complete (one regex pass)
+        found = {m.group(0) for m in _INCOMPLETE_CHECKS_RE.finditer(content)}
+
+        for check_str, description in _INCOMPLETE_CHECKS:
+            if check_str in found:
+                print(f"  {_OK} {description}")
             else:
-                print(f"  ⚠️  {description} - may not be present")
+                print(f"  {_WARN}  {description} - may not be present")
 
-        print("✅ Test 4 PASSED\n")
+        print(f"{_CHECK} Test 4 PASSED\n")
         return True
 
     except Exception as e:
-        print(f"❌ Test 4 FAILED: {e}\n")
+        print(f"{_FAIL} Test 4 FAILED: {e}\n")
         return False
 
 
@@ -211,17 +217,17 @@ def main():
     print(f"Validations passed: {passed}/{total}")
 
     if passed == total:
-        print("\n✅ ALL VALIDATIONS PASSED - Fix #3 is correctly implemented!")
+        print(f"\n{_CHECK} ALL VALIDATIONS PASSED - Fix #3 is correctly implemented!")
         print("\nThe orchestrator timeout protection includes:")
-        print("  ✓ as_completed() timeout (300s) for total execution")
-        print("  ✓ future.result() timeout (60s) for individual agents")
-        print("  ✓ TimeoutError exception handling")
-        print("  ✓ Proper error messages for timeouts")
-        print("  ✓ Incomplete agent handling")
+        print(f"  {_OK} as_completed() timeout (300s) for total execution")
+        print(f"  {_OK} future.result() timeout (60s) for individual agents")
+        print(f"  {_OK} TimeoutError exception handling")
+        print(f"  {_OK} Proper error messages for timeouts")
+        print(f"  {_OK} Incomplete agent handling")
         print("\nThis prevents indefinite hangs in agent execution.")
         return 0
     else:
-        print(f"\n❌ {total - passed} VALIDATION(S) FAILED")
+        print(f"\n{_FAIL} {total - passed} VALIDATION(S) FAILED")
         return 1
 
 
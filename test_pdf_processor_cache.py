@@ -0,0 +1,89 @@
+"""
+Tests for the on-disk PDF section extraction cache
+(rag_system/pdf_processor_cache.py)
+
+The processor is stubbed, so no PDF is parsed.
+"""
+
+import json
+from pathlib import Path
+
+from rag_system import pdf_processor_cache
+from rag_system.pdf_processor_cache import CACHE_VERSION, file_sha256, load_or_extract_sections
+
+
+class CountingProcessor:
+    """Stand-in for PDFProcessor; counts extract_text_by_sections() calls"""
+
+    def __init__(self, result=None):
+        self.calls = 0
+        self.result = result or {'success': True, 'sections': {'abstract': 'text'}, 'pages': []}
+
+    def extract_text_by_sections(self, pdf_path):
+        self.calls += 1
+        return self.result
+
+
+def _pdf(tmp_path, data=b"%PDF-1.4 fake\n%%EOF\n"):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(data)
+    return str(path)
+
+
+def _entry(cache_dir, pdf_path):
+    return Path(cache_dir) / f"{file_sha256(pdf_path)}_v{CACHE_VERSION}.json"
+
+
+def test_default_cache_dir_is_under_project_root():
+    """The default location does not depend on the working directory"""
+    project_root = Path(pdf_processor_cache.__file__).resolve().parent.parent
+    assert Path(pdf_processor_cache.DEFAULT_CACHE_DIR) == project_root / ".cache" / "pdf_sections"
+
+
+def test_miss_then_hit(tmp_path):
+    """The first call extracts and stores; the second is served from disk"""
+    pdf_path, cache_dir = _pdf(tmp_path), tmp_path / "cache"
+    processor = CountingProcessor()
+
+    first = load_or_extract_sections(pdf_path, processor, cache_dir=str(cache_dir))
+    assert processor.calls == 1
+    assert json.loads(_entry(cache_dir, pdf_path).read_text()) == first
+
+    second = load_or_extract_sections(pdf_path, processor, cache_dir=str(cache_dir))
+    assert processor.calls == 1
+    assert second == first
+
+
+def test_changed_file_is_a_miss(tmp_path):
+    """Entries are keyed by content, so different bytes re-extract"""
+    cache_dir = str(tmp_path / "cache")
+    processor = CountingProcessor()
+
+    load_or_extract_sections(_pdf(tmp_path), processor, cache_dir=cache_dir)
+    load_or_extract_sections(_pdf(tmp_path, b"%PDF-1.4 edited\n%%EOF\n"), processor, cache_dir=cache_dir)
+    assert processor.calls == 2
+
+
+def test_corrupt_entry_is_re_extracted(tmp_path):
+    """An unreadable entry is ignored and overwritten with a fresh extraction"""
+    pdf_path, cache_dir = _pdf(tmp_path), tmp_path / "cache"
+    entry = _entry(cache_dir, pdf_path)
+    entry.parent.mkdir(parents=True)
+    entry.write_text("{not json")
+    processor = CountingProcessor()
+
+    result = load_or_extract_sections(pdf_path, processor, cache_dir=str(cache_dir))
+    assert processor.calls == 1
+    assert result == processor.result
+    assert json.loads(entry.read_text()) == processor.result
+
+
+def test_failed_extraction_is_not_cached(tmp_path):
+    """Failures may be transient, so nothing is written for them"""
+    pdf_path, cache_dir = _pdf(tmp_path), tmp_path / "cache"
+    processor = CountingProcessor({'success': False, 'message': 'boom'})
+
+    load_or_extract_sections(pdf_path, processor, cache_dir=str(cache_dir))
+    load_or_extract_sections(pdf_path, processor, cache_dir=str(cache_dir))
+    assert processor.calls == 2
+    assert not _entry(cache_dir, pdf_path).exists()
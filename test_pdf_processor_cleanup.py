@@ -3,7 +3,10 @@ Test to verify PDF processor resource cleanup
 Tests Fix #10: Resource leaks in PDF processor
 """
 
+import ast
 import sys
+import atexit
+import functools
 from pathlib import Path
 import tempfile
 import fitz  # PyMuPDF
@@ -15,18 +18,39 @@ sys.path.insert(0, str(Path(__file__).parent))
 def create_test_pdf():
     """Create a simple test PDF for testing"""
     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-    doc = fitz.open()
+    # Release our handle so MuPDF can write the file (Windows refuses a second open)
+    temp_file.close()
 
-    # Add a few pages with text
-    for i in range(3):
-        page = doc.new_page()
-        page.insert_text((72, 72), f"Test Page {i+1}\nThis is test content for page {i+1}.")
+    with fitz.open() as doc:
+        # Add a few pages with text
+        for i in range(3):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Test Page {i+1}\nThis is test content for page {i+1}.")
+
+        doc.save(temp_file.name)
 
-    doc.save(temp_file.name)
-    doc.close()
     return temp_file.name
 
 
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_pdf():
+    """Test PDF built once and reused by the read-only cleanup tests"""
+    path = create_test_pdf()
+    atexit.register(Path(path).unlink, missing_ok=True)
+    return path
+
+def _is_doc_close(node):
+    """Whether node is a doc.close() call"""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == 'close'
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == 'doc'
+    )
+
+
 def test_finally_blocks_present():
     """Verify all PDF-opening methods have finally blocks"""
     print("Test 1: Finally blocks present in all PDF methods")
@@ -35,8 +59,12 @@ def test_finally_blocks_present():
     try:
         pdf_processor_path = Path("rag_system/pdf_processor.py")
 
-        with open(pdf_processor_path, 'r') as f:
-            content = f.read()
+        # Parse once; only real code counts, not comments or strings
+        tree = ast.parse(pdf_processor_path.read_text())
+        functions = {
+            node.name: node for node in ast.walk(tree)
+            if isinstance(node, ast.FunctionDef)
+        }
 
         # Methods that open PDFs
         pdf_methods = [
@@ -47,25 +75,22 @@ def test_finally_blocks_present():
         ]
 
         for method in pdf_methods:
-            # Find the method
-            method_start = content.find(f'def {method}(')
-            if method_start == -1:
+            fn = functions.get(method)
+            if fn is None:
                 raise Exception(f"Method {method} not found")
 
-            # Find the next method or end of class (larger window for extract_text_from_pdf)
-            next_def = content.find('\n    def ', method_start + 10)
-            if next_def == -1:
-                method_section = content[method_start:]
-            else:
-                method_section = content[method_start:next_def]
-
-            # Check for finally block
-            if 'finally:' not in method_section:
+            finally_bodies = [
+                node.finalbody for node in ast.walk(fn)
+                if isinstance(node, ast.Try) and node.finalbody
+            ]
+            if not finally_bodies:
                 raise Exception(f"Method {method} missing finally block")
 
             # Check for doc.close() in finally
-            finally_pos = method_section.find('finally:')
-            if 'doc.close()' not in method_section[finally_pos:]:
+            if not any(
+                _is_doc_close(node)
+                for body in finally_bodies for stmt in body for node in ast.walk(stmt)
+            ):
                 raise Exception(f"Method {method} doesn't close doc in finally block")
 
             print(f"  ✓ {method}() has proper finally block with doc.close()")
@@ -86,7 +111,7 @@ def test_extract_text_cleanup():
     try:
         from rag_system.pdf_processor import PDFProcessor
 
-        test_pdf = create_test_pdf()
+        test_pdf = _get_shared_pdf()
         processor = PDFProcessor()
 
         # Test successful extraction
@@ -105,16 +130,13 @@ def test_extract_text_cleanup():
 
         print("  ✓ Handled invalid PDF gracefully")
 
-        # Cleanup
-        Path(test_pdf).unlink()
-
         print("✅ Test 2 PASSED\n")
         return True
 
     except Exception as e:
         print(f"❌ Test 2 FAILED: {e}\n")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 
@@ -126,7 +148,7 @@ def test_get_page_text_cleanup():
     try:
         from rag_system.pdf_processor import PDFProcessor
 
-        test_pdf = create_test_pdf()
+        test_pdf = _get_shared_pdf()
         processor = PDFProcessor()
 
         # Test successful page retrieval
@@ -156,16 +178,13 @@ def test_get_page_text_cleanup():
 
         print("  ✓ Handled invalid PDF gracefully")
 
-        # Cleanup
-        Path(test_pdf).unlink()
-
         print("✅ Test 3 PASSED\n")
         return True
 
     except Exception as e:
         print(f"❌ Test 3 FAILED: {e}\n")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 
@@ -177,7 +196,7 @@ def test_get_page_count_cleanup():
     try:
         from rag_system.pdf_processor import PDFProcessor
 
-        test_pdf = create_test_pdf()
+        test_pdf = _get_shared_pdf()
         processor = PDFProcessor()
 
         # Test successful page count
@@ -196,16 +215,13 @@ def test_get_page_count_cleanup():
 
         print("  ✓ Handled invalid PDF gracefully (returned 0)")
 
-        # Cleanup
-        Path(test_pdf).unlink()
-
         print("✅ Test 4 PASSED\n")
         return True
 
     except Exception as e:
         print(f"❌ Test 4 FAILED: {e}\n")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 
@@ -217,7 +233,7 @@ def test_extract_images_info_cleanup():
     try:
         from rag_system.pdf_processor import PDFProcessor
 
-        test_pdf = create_test_pdf()
+        test_pdf = _get_shared_pdf()
         processor = PDFProcessor()
 
         # Test successful image info extraction
@@ -237,19 +253,67 @@ def test_extract_images_info_cleanup():
 
         print("  ✓ Handled invalid PDF gracefully (returned empty list)")
 
-        # Cleanup
-        Path(test_pdf).unlink()
-
         print("✅ Test 5 PASSED\n")
         return True
 
     except Exception as e:
         print(f"❌ Test 5 FAILED: {e}\n")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 
+def test_incomplete_pdf_rejected():
+    """Test truncated PDFs are rejected while trailing bytes after %%EOF are tolerated"""
+    print("Test 6: Truncated PDF rejected, trailing bytes tolerated")
+    print("-" * 60)
+
+    truncated = trailing = None
+    try:
+        from rag_system.pdf_processor import PDFProcessor
+
+        data = Path(_get_shared_pdf()).read_bytes()
+        processor = PDFProcessor()
+
+        # Cut the file off before its %%EOF marker, as an interrupted download would
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
+            f.write(data[:data.rindex(b'%%EOF')])
+            truncated = f.name
+
+        result = processor.extract_text_from_pdf(truncated)
+        if result['success'] or 'Incomplete PDF' not in result['message']:
+            raise Exception(f"Truncated PDF should be rejected, got: {result['message']}")
+        if processor.get_page_count(truncated) != 0:
+            raise Exception("get_page_count should return 0 for a truncated PDF")
+
+        print("  ✓ Truncated PDF rejected before opening")
+
+        # Valid PDF followed by more than the spec's 1024 bytes of junk
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
+            f.write(data + b'\n' + b'\0' * 4096)
+            trailing = f.name
+
+        result = processor.extract_text_from_pdf(trailing)
+        if not result['success'] or result['total_pages'] != 3:
+            raise Exception(f"PDF with trailing bytes should open, got: {result['message']}")
+
+        print("  ✓ PDF with 4 KB after %%EOF still opens")
+
+        print("✅ Test 6 PASSED\n")
+        return True
+
+    except Exception as e:
+        print(f"❌ Test 6 FAILED: {e}\n")
+        import traceback
+        traceback.print_exc(file=sys.stdout)
+        return False
+
+    finally:
+        for path in (truncated, trailing):
+            if path:
+                Path(path).unlink(missing_ok=True)
+
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -263,7 +327,8 @@ def main():
         test_extract_text_cleanup,
         test_get_page_text_cleanup,
         test_get_page_count_cleanup,
-        test_extract_images_info_cleanup
+        test_extract_images_info_cleanup,
+        test_incomplete_pdf_rejected
     ]
 
     results = []
@@ -287,6 +352,7 @@ def main():
         print("  ✓ Document handles always closed, even on exceptions")
         print("  ✓ Proper error handling maintains resource cleanup")
         print("  ✓ No file handle leaks in any code path")
+        print("  ✓ Truncated PDFs rejected before MuPDF opens them")
         print("\nFixed methods:")
         print("  • extract_text_from_pdf() - already had proper cleanup")
         print("  • get_page_text() - added try-finally block")
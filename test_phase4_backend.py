@@ -13,6 +13,7 @@ from pathlib import Path
 from rag_system.database import RAGDatabase
 from rag_system.document_chat import DocumentChatSystem
 from rag_system.paper_analysis_workflow import PaperAnalysisWorkflow
+import pytest
 
 
 def print_section(title: str):
@@ -73,6 +74,7 @@ def test_database_storage():
         return True
 
 
+@pytest.mark.integration
 def test_document_chat():
     """Test 2: Document chat system"""
     print_section("TEST 2: Document Chat System")
@@ -97,19 +99,22 @@ def test_document_chat():
         "How does the methodology work?"
     ]
 
-    for i, question in enumerate(test_questions, 1):
+    # One batched retrieval for all questions, then one completion each
+    start_time = time.perf_counter()
+    results = chat_system.chat_batch(
+        document_id=document_id,
+        questions=test_questions,
+        use_analysis=True,
+        use_rag=True,
+        save_to_history=False  # Don't save test questions
+    )
+    print(f"\n✓ Answered {len(results)} questions in {time.perf_counter() - start_time:.2f}s")
+
+    for i, (question, result) in enumerate(zip(test_questions, results), 1):
         print(f"\n--- Question {i} ---")
         print(f"Q: {question}")
 
-        start_time = time.time()
-        result = chat_system.chat(
-            document_id=document_id,
-            question=question,
-            use_analysis=True,
-            use_rag=True,
-            save_to_history=False  # Don't save test questions
-        )
-        elapsed_time = time.time() - start_time
+        elapsed_time = result.get('elapsed_time', 0)
 
         if result['success']:
             answer = result['answer']
@@ -202,6 +207,7 @@ def test_workflow_integration():
     return True
 
 
+@pytest.mark.integration
 def test_complete_workflow():
     """Test 4: Complete workflow (if needed)"""
     print_section("TEST 4: Complete Workflow (Optional)")
@@ -239,7 +245,7 @@ def run_all_tests():
     print("PHASE 4 BACKEND INTEGRATION TESTS")
     print("="*80)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = []
 
     # Test 1: Database storage
@@ -275,7 +281,7 @@ def run_all_tests():
         results.append(("Complete Workflow", False))
 
     # Summary
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
     passed = sum(1 for _, result in results if result)
     total = len(results)
 
@@ -9,7 +9,9 @@ sys.path.append('.')
 from api_clients import SemanticScholarClient
 from paper_content_extractor import PaperContentExtractor
 import config
+import pytest
 
+@pytest.mark.integration
 def test_quantum_computing_search():
     """Test search for quantum computing papers"""
     print("=" * 80)
@@ -44,6 +46,7 @@ def test_quantum_computing_search():
         return []
 
 
+@pytest.mark.integration
 def test_content_extraction(paper):
     """Test metadata content extraction"""
     print("\n" + "=" * 80)
@@ -7,6 +7,10 @@ import sys
 import traceback
 from grok_client import GrokClient
 import config
+import pytest
+
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
 print("="*80)
 print(" COMPREHENSIVE RAG INTEGRATION TEST")
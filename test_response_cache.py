@@ -0,0 +1,98 @@
+"""
+Tests for the opt-in LLM response cache used by the analysis agents
+(rag_system/analysis_agents/_response_cache.py)
+
+The agent is given a stub client, so no request leaves the process.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")  # rag_system.analysis_agents imports it at package level
+
+from rag_system.analysis_agents import _response_cache
+from rag_system.analysis_agents.base_agent import BaseAnalysisAgent
+
+
+class StubCompletions:
+    """Stand-in for client.chat.completions; counts create() calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"summary": "ok"}'))],
+            usage=SimpleNamespace(total_tokens=42)
+        )
+
+
+class EchoAgent(BaseAnalysisAgent):
+    """Minimal agent whose prompts depend only on the section text"""
+
+    def __init__(self):
+        super().__init__("EchoAgent", "Echo")
+        self.completions = StubCompletions()
+        self.client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+    def get_system_prompt(self):
+        return "Summarize."
+
+    def get_user_prompt(self, section_text, paper_metadata):
+        return section_text
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Enable the cache against a fresh database file"""
+    monkeypatch.setenv("LLM_CACHE", "1")
+    path = tmp_path / "llm_responses.db"
+    monkeypatch.setattr(_response_cache, "CACHE_PATH", path)
+    return path
+
+
+def test_cache_is_opt_in(monkeypatch):
+    """Caching stays off unless LLM_CACHE=1"""
+    monkeypatch.delenv("LLM_CACHE", raising=False)
+    assert not _response_cache.enabled()
+    monkeypatch.setenv("LLM_CACHE", "1")
+    assert _response_cache.enabled()
+
+
+def test_get_put_hit_and_miss(cache_path):
+    """Stored values are returned for the same key only"""
+    key = _response_cache.make_key(agent_name="a", user_prompt="x")
+    assert _response_cache.make_key(user_prompt="x", agent_name="a") == key
+
+    assert _response_cache.get(key) is None
+    _response_cache.put(key, {'raw_response': 'r', 'tokens_used': 1})
+    assert _response_cache.get(key) == {'raw_response': 'r', 'tokens_used': 1}
+    assert _response_cache.get(_response_cache.make_key(agent_name="a", user_prompt="y")) is None
+    assert cache_path.exists()
+
+
+def test_agent_reuses_cached_response(cache_path):
+    """A repeated identical request is served from the cache; a changed one is not"""
+    agent = EchoAgent()
+
+    first = agent.analyze("section text")
+    second = agent.analyze("section text")
+    assert agent.completions.calls == 1
+    assert second['success'] and second['analysis'] == first['analysis'] == {"summary": "ok"}
+    assert second['tokens_used'] == 42
+
+    agent.analyze("other section text")
+    assert agent.completions.calls == 2
+
+
+def test_agent_skips_cache_when_disabled(cache_path, monkeypatch):
+    """With LLM_CACHE unset every request reaches the client"""
+    monkeypatch.delenv("LLM_CACHE")
+    agent = EchoAgent()
+
+    agent.analyze("section text")
+    agent.analyze("section text")
+    assert agent.completions.calls == 2
+    assert not cache_path.exists()
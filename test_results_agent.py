@@ -5,8 +5,13 @@ Test ResultsAgent with Transformer Paper
 
 import sys
 import json
+from textwrap import fill
 from rag_system.pdf_processor import PDFProcessor
 from rag_system.analysis_agents.results_agent import ResultsAgent
+import pytest
+
+# Calls the live LLM/API; run with: pytest -m integration
+pytestmark = pytest.mark.integration
 
 
 def test_results_agent():
@@ -118,16 +123,8 @@ def test_results_agent():
         comparison_summary = comparisons.get('performance_comparison', 'Not provided')
         if comparison_summary != 'Not provided':
             print(f"\n  Performance comparison:")
-            words = comparison_summary.split()
-            line = "    "
-            for word in words[:50]:
-                if len(line) + len(word) + 1 <= 80:
-                    line += word + " "
-                else:
-                    print(line.strip())
-                    line = "    " + word + " "
-            if line.strip():
-                print(line.strip())
+            print(fill(' '.join(comparison_summary.split()[:50]), width=80,
+                       initial_indent="    ", subsequent_indent="    "))
 
         print("\n⚠️  UNEXPECTED RESULTS:")
         print("-" * 80)
@@ -147,16 +144,7 @@ def test_results_agent():
         print("\n🔍 CRITICAL ANALYSIS:")
         print("-" * 80)
         critical = analysis.get('critical_analysis', 'Not provided')
-        words = critical.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= 80:
-                line += word + " "
-            else:
-                print(line.strip())
-                line = word + " "
-        if line:
-            print(line.strip())
+        print(fill(critical, width=80))
 
         print("\n" + "=" * 80)
         print("✅ RESULTSAGENT TEST PASSED!")
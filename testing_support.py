@@ -0,0 +1,69 @@
+"""
+Shared helpers for the standalone test scripts (test_*.py)
+"""
+
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Only the scripts that dump results to JSON need it
+    pass
+else:
+    # Pretty-printed result dumps; numpy values and non-str dict keys are serialized too
+    ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def stdout_can_encode(text):
+    """Whether sys.stdout's encoding can represent text"""
+    try:
+        text.encode(sys.stdout.encoding or "ascii")
+        return True
+    except (UnicodeEncodeError, LookupError):
+        return False
+
+
+# Status marks (ok, timeout, fail, pass, warn); fall back to ASCII when stdout
+# cannot encode them (e.g. PYTHONIOENCODING=ascii in CI) instead of raising
+# UnicodeEncodeError
+STATUS_MARKS = (
+    ("✓", "⏱️", "❌", "✅", "⚠️") if stdout_can_encode("✓⏱️❌✅⚠️")
+    else ("[OK]", "[TO]", "[FAIL]", "[PASS]", "[WARN]")
+)
+
+
+def get_test_logger(name):
+    """
+    Logger for a test script, at the level named by LOG_LEVEL (default INFO)
+
+    Failing tests log full tracebacks at DEBUG, so normal runs print just the
+    error. An unknown level name (e.g. LOG_LEVEL=verbose) falls back to INFO
+    instead of failing the import.
+    """
+    logger = logging.getLogger(name)
+    level = getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), None)
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+    return logger
+
+
+# One worker pool shared by the orchestrator timeout tests; threads are created
+# on first use and reused afterwards instead of being started and joined per test
+WORKER_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix="orch_test")
+
+# Tasks wait on a per-test stop event instead of sleeping, and each test sets
+# its event when done so abandoned workers return to the pool. A fresh event
+# per test is never cleared, so a task that starts waiting late still sees it.
+
+
+@dataclass(slots=True)
+class TaskResult:
+    """Outcome of one task submitted to WORKER_POOL"""
+    success: bool
+    error: str = ""
+    result: Any = None